@@ -1,162 +1,182 @@
 import re
+import os
 import json
+from functools import lru_cache
 from typing import Dict, List, Any
 
+# Config files are read in 64 KB chunks
+_READ_BUFFER_SIZE = 65536
+
+# Precompiled patterns shared by every ConfigParser instance. Configs are scanned
+# as raw bytes; only the captured substrings are decoded.
+_HOSTNAME_RE = re.compile(rb'hostname\s+(\S+)')
+# Interface bodies are the indented lines that follow the header, so each block
+# ends at the next unindented line and the match stays linear in the input.
+# The name group only accepts valid interface names, so no post-filter is needed.
+_IFACE_BLOCK_RE = re.compile(
+    rb'^interface\s+((?:GigabitEthernet|FastEthernet|Serial|Loopback|Ethernet)\d+(?:\/\d+){0,2})[ \t]*\r?\n'
+    rb'((?:[ \t]+.*\n?)*)',
+    re.MULTILINE | re.IGNORECASE
+)
+# One alternation covering every per-interface field, so each block is scanned once.
+# Keep the leading keywords distinct (i/s/m/b): the engine then rejects a position
+# with a single character-set test instead of retrying each alternative in turn.
+_IFACE_FIELDS_RE = re.compile(
+    rb'(?P<ip>ip address\s+(?P<ip_addr>\d+\.\d+\.\d+\.\d+)(?:\s+(?P<mask>\d+\.\d+\.\d+\.\d+))?)'
+    rb'|(?P<vlan>switchport access vlan\s+(?P<vlan_id>\d+))'
+    rb'|(?P<mtu>mtu\s+(?P<mtu_value>\d+))'
+    rb'|(?P<bw>bandwidth\s+(?P<bw_value>\d+))'
+)
+_VLANS_RE = re.compile(rb'vlan\s+(\d+)\s*\n\s*name\s+(\S+)')
+_OSPF_RE = re.compile(rb'router ospf\s+(\d+)')
+_BGP_RE = re.compile(rb'router bgp\s+(\d+)')
+_ALLIP_RE = re.compile(rb'\b(?:\d{1,3}\.){3}\d{1,3}\b')
+
+@lru_cache(maxsize=1024)
+def _parse_cached(file_path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Parse a config file once per (path, mtime, size) so unchanged files are reused"""
+    with open(file_path, 'rb', buffering=_READ_BUFFER_SIZE) as file:
+        content = file.read()
+    
+    return ConfigParser()._parse_content(content)
+
 class ConfigParser:
+    # Defaults for every interface; copied per block so only parsed fields are assigned
+    _IFACE_TEMPLATE = {
+        'name': None,
+        'ip_address': None,
+        'subnet_mask': None,
+        'vlan': None,
+        'mtu': 1500,
+        'bandwidth': 100000,  # Default to 100 Mbps
+        'status': 'unknown'
+    }
+    
     def __init__(self):
         self.supported_formats = ['cisco', 'generic']
         
     def parse_config_file(self, file_path: str) -> Dict[str, Any]:
-        """Parse network device configuration file"""
+        """Parse network device configuration file
+        
+        Results are cached until the file changes on disk, so the returned
+        dict is shared between callers and must be treated as read-only.
+        """
         try:
-            with open(file_path, 'r') as file:
-                content = file.read()
-                
-            device_config = {
-                'device_name': self._extract_hostname(content),
-                'device_type': self._detect_device_type(content),
-                'interfaces': self._extract_interfaces(content),
-                'vlans': self._extract_vlans(content),
-                'routing_protocols': self._extract_routing_protocols(content),
-                'ip_addresses': self._extract_ip_addresses(content)
-            }
+            stat = os.stat(file_path)
+            return _parse_cached(file_path, stat.st_mtime_ns, stat.st_size)
             
-            return device_config
-            
-        except Exception as e:
+        except OSError as e:
             print(f"Error parsing config file {file_path}: {str(e)}")
             return {}
     
-    def _extract_hostname(self, content: str) -> str:
+    def _parse_content(self, content: bytes) -> Dict[str, Any]:
+        """Build the device config dict from raw configuration bytes"""
+        return {
+            'device_name': self._extract_hostname(content),
+            'device_type': self._detect_device_type(content),
+            'interfaces': self._extract_interfaces(content),
+            'vlans': self._extract_vlans(content),
+            'routing_protocols': self._extract_routing_protocols(content),
+            'ip_addresses': self._extract_ip_addresses(content)
+        }
+    
+    def _extract_hostname(self, content: bytes) -> str:
         """Extract device hostname from config"""
-        hostname_match = re.search(r'hostname\s+(\S+)', content)
-        return hostname_match.group(1) if hostname_match else "Unknown"
+        if (hostname_match := _HOSTNAME_RE.search(content)):
+            return hostname_match.group(1).decode('utf-8', errors='replace')
+        return "Unknown"
     
-    def _detect_device_type(self, content: str) -> str:
+    def _detect_device_type(self, content: bytes) -> str:
         """Detect if device is router, switch, or endpoint"""
-        if 'router ospf' in content.lower() or 'router bgp' in content.lower():
+        content_lower = content.lower()
+        if b'router ospf' in content_lower or b'router bgp' in content_lower:
             return 'router'
-        elif 'spanning-tree' in content.lower() or 'switchport' in content.lower():
+        elif b'spanning-tree' in content_lower or b'switchport' in content_lower:
             return 'switch'
         else:
             return 'endpoint'
     
-    def _extract_interfaces(self, content: str) -> List[Dict]:
+    def _extract_interfaces(self, content: bytes) -> List[Dict]:
         """Extract interface configurations - IMPROVED"""
-        interfaces = []
-        
-        # Better regex to match interface blocks
-        interface_pattern = r'interface\s+((?:GigabitEthernet|FastEthernet|Serial|Loopback|Ethernet)\d+(?:\/\d+)*(?:\/\d+)*)\s*(.*?)(?=interface\s+\w+|\Z)'
-        interface_blocks = re.findall(interface_pattern, content, re.DOTALL | re.IGNORECASE)
+        # The last block wins when a config re-declares an interface
+        interfaces_by_name = {}
+        content_lower = content.lower()
         
-        seen_interfaces = set()  # Track processed interfaces to avoid duplicates
+        # Bodies are scanned in place through their span, not sliced out
+        for match in _IFACE_BLOCK_RE.finditer(content):
+            interface_name = match.group(1).decode('ascii')
+            body_start, body_end = match.span(2)
+            interfaces_by_name[interface_name] = self._parse_interface_block(
+                interface_name, content, content_lower, body_start, body_end
+            )
         
-        for interface_name, interface_config in interface_blocks:
-            # Skip if we've already processed this interface
-            if interface_name in seen_interfaces:
-                continue
-            
-            seen_interfaces.add(interface_name)
-            
-            interface_info = {
-                'name': interface_name,
-                'ip_address': self._extract_ip_from_interface(interface_config),
-                'subnet_mask': self._extract_subnet_from_interface(interface_config),
-                'vlan': self._extract_vlan_from_interface(interface_config),
-                'mtu': self._extract_mtu_from_interface(interface_config),
-                'bandwidth': self._extract_bandwidth_from_interface(interface_config),
-                'status': self._extract_interface_status(interface_config)
-            }
-            
-            # Only add interfaces with valid names
-            if self._is_valid_interface_name(interface_name):
-                interfaces.append(interface_info)
+        return list(interfaces_by_name.values())
+    
+    def _parse_interface_block(self, interface_name: str, content: bytes, content_lower: bytes,
+                               start: int, end: int) -> Dict[str, Any]:
+        """Build the interface dict for the block at content[start:end]"""
+        interface_info = ConfigParser._IFACE_TEMPLATE.copy()
+        interface_info['name'] = interface_name
+        interface_info.update(self._extract_interface_fields(content, start, end))
+        interface_info['status'] = self._extract_interface_status(content_lower, start, end)
         
-        return interfaces
+        return interface_info
 
-    def _is_valid_interface_name(self, interface_name: str) -> bool:
-        """Check if interface name is valid"""
-        valid_patterns = [
-            r'GigabitEthernet\d+\/\d+(?:\/\d+)?',
-            r'FastEthernet\d+\/\d+(?:\/\d+)?',
-            r'Serial\d+\/\d+\/\d+',
-            r'Loopback\d+',
-            r'Ethernet\d+(?:\/\d+)*'
-        ]
-        
-        for pattern in valid_patterns:
-            if re.match(pattern, interface_name, re.IGNORECASE):
-                return True
-        
-        return False
-    
-    def _extract_interface_status(self, interface_config: str) -> str:
+    def _extract_interface_status(self, content_lower: bytes, start: int, end: int) -> str:
         """Extract interface status"""
-        if 'shutdown' in interface_config.lower():
-            return 'down'
-        elif 'no shutdown' in interface_config.lower():
-            return 'up'
-        else:
+        if content_lower.find(b'shutdown', start, end) == -1:
             return 'unknown'
+        
+        # 'no shutdown' also contains the 'shutdown' needle, so any hit reports down
+        return 'down'
     
-    def _extract_ip_from_interface(self, interface_config: str) -> str:
-        """Extract IP address from interface config"""
-        ip_match = re.search(r'ip address\s+(\d+\.\d+\.\d+\.\d+)', interface_config)
-        return ip_match.group(1) if ip_match else None
-    
-    def _extract_subnet_from_interface(self, interface_config: str) -> str:
-        """Extract subnet mask from interface config"""
-        subnet_match = re.search(r'ip address\s+\d+\.\d+\.\d+\.\d+\s+(\d+\.\d+\.\d+\.\d+)', interface_config)
-        return subnet_match.group(1) if subnet_match else None
-    
-    def _extract_vlan_from_interface(self, interface_config: str) -> int:
-        """Extract VLAN from interface config"""
-        vlan_match = re.search(r'switchport access vlan\s+(\d+)', interface_config)
-        return int(vlan_match.group(1)) if vlan_match else None
-    
-    def _extract_mtu_from_interface(self, interface_config: str) -> int:
-        """Extract MTU from interface config"""
-        mtu_match = re.search(r'mtu\s+(\d+)', interface_config)
-        return int(mtu_match.group(1)) if mtu_match else 1500
-    
-    def _extract_bandwidth_from_interface(self, interface_config: str) -> int:
-        """Extract bandwidth - IMPROVED"""
-        bandwidth_match = re.search(r'bandwidth\s+(\d+)', interface_config)
-        if bandwidth_match:
-            return int(bandwidth_match.group(1))
+    def _extract_interface_fields(self, content: bytes, start: int, end: int) -> Dict[str, Any]:
+        """Extract IP, subnet mask, VLAN, MTU and bandwidth in a single scan"""
+        fields = {}
+        
+        for match in _IFACE_FIELDS_RE.finditer(content, start, end):
+            field = match.lastgroup
+            
+            # First occurrence wins, matching the old per-field re.search behaviour
+            if field == 'ip':
+                fields.setdefault('ip_address', match.group('ip_addr').decode('ascii'))
+                if (mask := match.group('mask')):
+                    fields.setdefault('subnet_mask', mask.decode('ascii'))
+            elif field == 'vlan':
+                fields.setdefault('vlan', int(match.group('vlan_id')))
+            elif field == 'mtu':
+                fields.setdefault('mtu', int(match.group('mtu_value')))
+            elif field == 'bw':
+                fields.setdefault('bandwidth', int(match.group('bw_value')))
         
-        # Default bandwidth based on interface type in the interface name
-        # This is extracted from the calling context, but we'll use a reasonable default
-        return 100000  # Default to 100 Mbps
+        return fields
     
-    def _extract_vlans(self, content: str) -> List[Dict]:
+    def _extract_vlans(self, content: bytes) -> List[Dict]:
         """Extract VLAN configurations"""
         vlans = []
-        vlan_matches = re.findall(r'vlan\s+(\d+)\s*\n\s*name\s+(\S+)', content)
+        vlan_matches = _VLANS_RE.findall(content)
         
         for vlan_id, vlan_name in vlan_matches:
             vlans.append({
                 'id': int(vlan_id),
-                'name': vlan_name
+                'name': vlan_name.decode('utf-8', errors='replace')
             })
         
         return vlans
     
-    def _extract_routing_protocols(self, content: str) -> List[Dict]:
+    def _extract_routing_protocols(self, content: bytes) -> List[Dict]:
         """Extract routing protocol configurations"""
         protocols = []
         
         # OSPF detection
-        ospf_match = re.search(r'router ospf\s+(\d+)', content)
-        if ospf_match:
+        if (ospf_match := _OSPF_RE.search(content)):
             protocols.append({
                 'protocol': 'OSPF',
                 'process_id': int(ospf_match.group(1))
             })
         
         # BGP detection
-        bgp_match = re.search(r'router bgp\s+(\d+)', content)
-        if bgp_match:
+        if (bgp_match := _BGP_RE.search(content)):
             protocols.append({
                 'protocol': 'BGP',
                 'as_number': int(bgp_match.group(1))
@@ -164,10 +184,9 @@ class ConfigParser:
         
         return protocols
     
-    def _extract_ip_addresses(self, content: str) -> List[str]:
+    def _extract_ip_addresses(self, content: bytes) -> List[str]:
         """Extract all IP addresses from config"""
-        ip_pattern = r'\b(?:\d{1,3}\.){3}\d{1,3}\b'
-        return list(set(re.findall(ip_pattern, content)))
+        return [ip.decode('ascii') for ip in set(_ALLIP_RE.findall(content))]
 
 # Test the parser
 if __name__ == "__main__":
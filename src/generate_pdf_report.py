@@ -1,502 +1,582 @@
+import reportlab
 from reportlab.lib.pagesizes import A4
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak, Image, KeepTogether
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak, CondPageBreak, KeepTogether, LongTable, XPreformatted
+from reportlab.lib.styles import ParagraphStyle
 from reportlab.lib.units import inch, mm
 from reportlab.lib import colors
 from datetime import datetime
+from functools import lru_cache
+from xml.sax.saxutils import escape
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+import hashlib
 import os
 
-def create_improved_cisco_vip_report():
-    """Generate improved professional Cisco VIP 2025 PDF report with better layout"""
-    
-    # Ensure output directory exists
-    output_dir = "../output"
-    if not os.path.exists(output_dir):
-        os.makedirs(output_dir)
-    
-    # Create PDF document with improved layout settings
-    pdf_path = os.path.join(output_dir, "Cisco_VIP_2025_Improved_Report_Harshal_Sakpal.pdf")
-    doc = SimpleDocTemplate(
-        pdf_path, 
-        pagesize=A4,
-        rightMargin=15*mm,
-        leftMargin=15*mm,
-        topMargin=20*mm,
-        bottomMargin=25*mm,  # Increased bottom margin
-        allowSplitting=1,    # Allow content splitting
-        showBoundary=0       # Hide boundaries in production
-    )
-    
-    # Get styles and create custom styles
-    styles = getSampleStyleSheet()
-    
-    # Cover page title style
-    cover_title_style = ParagraphStyle(
-        'CoverTitle',
-        parent=styles['Title'],
-        fontSize=26,  # Slightly larger
-        spaceAfter=25,
-        alignment=1,
-        textColor=colors.HexColor('#1f4e79'),
-        fontName='Helvetica-Bold',
-        leading=30
-    )
-    
-    # Cover subtitle style
-    cover_subtitle_style = ParagraphStyle(
-        'CoverSubtitle',
-        parent=styles['Heading2'],
-        fontSize=20,  # Slightly larger
-        spaceAfter=35,
-        alignment=1,
-        textColor=colors.HexColor('#2f5f8f'),
-        fontName='Helvetica',
-        leading=24
-    )
-    
-    # Cover info style
-    cover_info_style = ParagraphStyle(
-        'CoverInfo',
-        parent=styles['Normal'],
-        fontSize=14,
-        spaceAfter=8,
-        alignment=1,
-        fontName='Helvetica',
-        leading=18
-    )
-    
-    # Section heading style - improved spacing
-    heading_style = ParagraphStyle(
-        'SectionHeading',
-        parent=styles['Heading1'],
-        fontSize=18,  # Slightly larger
-        spaceAfter=18,
-        spaceBefore=30,
-        textColor=colors.HexColor('#1f4e79'),
-        fontName='Helvetica-Bold',
-        leading=20,
-        keepWithNext=True  # Keep with following content
-    )
-    
-    # Subheading style - improved spacing
-    subheading_style = ParagraphStyle(
-        'SubHeading',
-        parent=styles['Heading2'],
-        fontSize=15,  # Slightly larger
-        spaceAfter=12,
-        spaceBefore=20,
-        textColor=colors.HexColor('#2f5f8f'),
-        fontName='Helvetica-Bold',
-        leading=17,
-        keepWithNext=True  # Keep with following content
-    )
-    
-    # Normal text style - improved spacing
-    normal_style = ParagraphStyle(
-        'CustomNormal',
-        parent=styles['Normal'],
-        fontSize=11,
-        spaceAfter=10,  # Increased spacing
-        spaceBefore=5,
-        fontName='Helvetica',
-        leading=14,  # Better line spacing
-        alignment=0
-    )
-    
-    # Bullet style - improved
-    bullet_style = ParagraphStyle(
-        'BulletStyle',
-        parent=styles['Normal'],
-        fontSize=11,
-        spaceAfter=6,  # Better spacing
-        spaceBefore=3,
-        leftIndent=20,  # Better indentation
-        bulletIndent=10,
-        fontName='Helvetica',
-        leading=14
-    )
-    
-    # Table cell styles - improved
-    table_cell_style = ParagraphStyle(
-        'TableCell',
-        parent=styles['Normal'],
-        fontSize=10,
-        fontName='Helvetica',
-        leading=13,  # Better line spacing
-        alignment=0
-    )
-    
-    table_header_style = ParagraphStyle(
-        'TableHeader',
-        parent=styles['Normal'],
-        fontSize=11,  # Slightly larger
-        fontName='Helvetica-Bold',
-        leading=14,
-        alignment=1,
-        textColor=colors.white
-    )
+# Network performance summary
+HEALTH_HEADERS = ("Performance Metric", "Achievement")
+HEALTH_ROWS = [
+    ("End-to-End Connectivity", "✓ 100% Success Rate"),
+    ("Local Network Tests", "✓ All Tests Passed"),
+    ("Inter-Site Routing", "✓ Fully Functional"),
+    ("Network Convergence", "✓ Optimal Performance"),
+    ("Configuration Validation", "✓ No Issues Detected")
+]
+
+# Network architecture specifications
+ARCH_HEADERS = ("Network Component", "IP Specification", "Technical Details")
+ARCH_ROWS = [
+    ("Site A LAN Network", "192.168.10.0/24", "Router1 + Switch1 + PC1/PC2<br/>254 available host addresses"),
+    ("Site B LAN Network", "192.168.20.0/24", "Router2 + Switch2 + PC3/PC4<br/>254 available host addresses"),
+    ("WAN Connection Link", "10.0.0.0/30", "Point-to-point serial connection<br/>2 usable host addresses"),
+    ("Routing Implementation", "Static Routing", "Manually configured routes<br/>Predictable and secure path selection"),
+    ("Hardware Infrastructure", "Cisco Enterprise Class", "ISR 1941 Routers<br/>Catalyst Managed Switches")
+]
+
+# IP addressing scheme
+IP_HEADERS = ("Network Device", "Interface Type", "IP Address", "Subnet Mask", "Network Role")
+IP_ROWS = [
+    ("Router1", "GigabitEthernet0/0", "192.168.10.1", "255.255.255.0", "Site A Gateway"),
+    ("Router1", "Serial0/0/0", "10.0.0.1", "255.255.255.252", "WAN Endpoint"),
+    ("Router2", "GigabitEthernet0/0", "192.168.20.1", "255.255.255.0", "Site B Gateway"),
+    ("Router2", "Serial0/0/0", "10.0.0.2", "255.255.255.252", "WAN Endpoint"),
+    ("PC1 (Site A)", "FastEthernet0", "192.168.10.10", "255.255.255.0", "End Device"),
+    ("PC2 (Site A)", "FastEthernet0", "192.168.10.11", "255.255.255.0", "End Device"),
+    ("PC3 (Site B)", "FastEthernet0", "192.168.20.10", "255.255.255.0", "End Device"),
+    ("PC4 (Site B)", "FastEthernet0", "192.168.20.11", "255.255.255.0", "End Device")
+]
+
+# End device configuration
+PC_HEADERS = ("Device", "IP Address", "Subnet Mask", "Default Gateway", "Network Segment")
+PC_ROWS = [
+    ("PC1", "192.168.10.10", "255.255.255.0", "192.168.10.1", "Site A LAN"),
+    ("PC2", "192.168.10.11", "255.255.255.0", "192.168.10.1", "Site A LAN"),
+    ("PC3", "192.168.20.10", "255.255.255.0", "192.168.20.1", "Site B LAN"),
+    ("PC4", "192.168.20.11", "255.255.255.0", "192.168.20.1", "Site B LAN")
+]
+
+# Connectivity test results
+TEST_HEADERS = ("Test Category", "Source Device", "Target Address", "Test Result", "Technical Analysis")
+TEST_ROWS = [
+    ("Local Gateway", "PC1", "192.168.10.1", "✓ SUCCESS", "Direct gateway connectivity verified"),
+    ("Same Subnet", "PC1", "192.168.10.11", "✓ SUCCESS", "Layer 2 switching operational"),
+    ("Remote Gateway", "PC1", "192.168.20.1", "✓ SUCCESS", "Static routing functional"),
+    ("End-to-End", "PC1", "192.168.20.10", "✓ SUCCESS", "Complete network connectivity"),
+    ("Cross-Network", "PC2", "192.168.20.11", "✓ SUCCESS", "Bidirectional routing verified"),
+    ("Return Path", "PC3", "192.168.10.10", "✓ SUCCESS", "Symmetric routing confirmed"),
+    ("WAN Interface", "PC4", "10.0.0.1", "✓ SUCCESS", "WAN connectivity established")
+]
+
+# Project statistics
+STATS_HEADERS = ("Project Metric", "Achievement Details")
+STATS_ROWS = [
+    ("Network Infrastructure", "6 devices configured (2 ISR routers, 2 switches, 4 PCs)"),
+    ("IP Network Implementation", "3 subnets deployed (2 LAN segments, 1 WAN connection)"),
+    ("Routing Configuration", "2 bidirectional static routes with next-hop specification"),
+    ("Connectivity Success Rate", "100% success across all 8 connectivity test scenarios"),
+    ("Validation Methodology", "Multi-layer testing: CLI validation + simulation analysis"),
+    ("Documentation Standard", "Professional technical documentation with visual evidence"),
+    ("Performance Metrics", "Optimal network convergence and packet delivery rates"),
+    ("Industry Compliance", "Cisco best practices and enterprise configuration standards")
+]
+
+# Key project achievements
+ACHIEVEMENTS = [
+    ("Network Topology", "Successfully designed and implemented 2-router enterprise topology with 4 endpoint devices"),
+    ("Static Routing", "Configured bidirectional static routes enabling seamless inter-site communication"),
+    ("Connectivity Validation", "Achieved 100% end-to-end network connectivity across both local and remote networks"),
+    ("Professional Testing", "Demonstrated comprehensive network troubleshooting using multiple validation methodologies"),
+    ("Scalable Architecture", "Created enterprise-grade network foundation suitable for production deployment"),
+    ("Documentation Standards", "Produced professional technical documentation meeting industry standards")
+]
+
+# Router1 configuration details
+ROUTER1_CONFIGS = [
+    ("LAN Interface", "GigabitEthernet0/0 configured with IP 192.168.10.1/24 serving as local gateway"),
+    ("WAN Interface", "Serial0/0/0 configured with IP 10.0.0.1/30 at 64000 bps for inter-site connectivity"),
+    ("Static Route", "Destination 192.168.20.0/24 via next-hop 10.0.0.2 for Site B network access"),
+    ("Interface Status", "All interfaces activated with proper duplex and speed configuration"),
+    ("Security", "Console and VTY access configured with appropriate authentication")
+]
+
+# Router2 configuration details
+ROUTER2_CONFIGS = [
+    ("LAN Interface", "GigabitEthernet0/0 configured with IP 192.168.20.1/24 serving as local gateway"),
+    ("WAN Interface", "Serial0/0/0 configured with IP 10.0.0.2/30 at 64000 bps for inter-site connectivity"),
+    ("Static Route", "Destination 192.168.10.0/24 via next-hop 10.0.0.1 for Site A network access"),
+    ("Interface Status", "All interfaces operational with optimized performance settings"),
+    ("Redundancy", "Configuration backup and startup-config synchronization implemented")
+]
+
+# Simulation mode analysis
+SIMULATION_POINTS = [
+    ("Device Discovery", "Simulation demonstrates proper network topology recognition and device identification"),
+    ("Packet Flow Analysis", "Visual confirmation of routing path through Router1, WAN link, and Router2"),
+    ("Protocol Operations", "Detailed ARP resolution, frame encapsulation, and routing table operations"),
+    ("Network Convergence", "Realistic timing analysis showing proper network learning behavior"),
+    ("Layer Validation", "Comprehensive Layer 2 switching and Layer 3 routing verification"),
+    ("Performance Metrics", "Network latency and throughput analysis within acceptable parameters")
+]
+
+# Technical verification documentation
+VERIFICATION_EVIDENCE = [
+    ("Configuration Validation", "Complete running-config outputs showing proper interface and routing setup"),
+    ("Connectivity Evidence", "Command-line ping results demonstrating successful network communication"),
+    ("ARP Resolution", "MAC address learning and ARP table population across network segments"),
+    ("Routing Analysis", "Static route functionality and proper path selection verification"),
+    ("Protocol Verification", "Layer 2 and Layer 3 protocol operations confirmed through simulation"),
+    ("Performance Assessment", "Network response times and packet delivery success rates documented")
+]
+
+# Objectives achieved
+OBJECTIVES_ACHIEVED = [
+    ("Network Design Excellence", "Implemented hierarchical network architecture following Cisco best practices"),
+    ("Static Routing Mastery", "Successfully configured bidirectional static routes enabling seamless communication"),
+    ("Complete Connectivity", "Achieved 100% network connectivity validation across all test scenarios"),
+    ("Professional Standards", "Demonstrated enterprise-level configuration and documentation practices"),
+    ("Scalability Foundation", "Created infrastructure capable of supporting future expansion requirements"),
+    ("Performance Optimization", "Delivered network solution with optimal routing and switching performance")
+]
+
+# Technical skills demonstrated
+TECHNICAL_SKILLS = [
+    ("Cisco Router Configuration", "Expert-level CLI-based configuration of ISR routers with advanced interface management"),
+    ("Static Routing Implementation", "Professional configuration of static routes with next-hop and administrative distance"),
+    ("Network Architecture Design", "Application of hierarchical design principles for enterprise-grade scalability"),
+    ("IP Addressing & VLSM", "Efficient IP address space utilization with Variable Length Subnet Masking"),
+    ("Layer 2 Technologies", "Advanced understanding of switching operations and VLAN implementation concepts"),
+    ("Network Troubleshooting", "Systematic diagnostic approach using multiple validation and testing methodologies"),
+    ("Protocol Analysis", "Deep understanding of ARP, frame forwarding, and routing protocol operations"),
+    ("Professional Documentation", "Creation of comprehensive technical documentation meeting industry standards"),
+    ("Performance Optimization", "Network tuning and configuration optimization for maximum efficiency"),
+    ("Security Implementation", "Application of network security best practices and access control methods")
+]
+
+# Learning outcomes
+LEARNING_OUTCOMES = [
+    ("Real-World Application", "Practical experience implementing enterprise solutions using industry-standard equipment"),
+    ("Professional Methodologies", "Exposure to systematic network design, implementation, and validation processes"),
+    ("Industry Best Practices", "Comprehensive understanding of Cisco networking standards and configuration methodologies"),
+    ("Analytical Problem-Solving", "Development of advanced troubleshooting and network optimization skills"),
+    ("Career Readiness", "Hands-on preparation for network engineering and infrastructure management roles"),
+    ("Technical Leadership", "Experience in project planning, execution, and professional documentation standards")
+]
+
+# Report colour palette, parsed once per process
+C_NAVY = colors.HexColor('#1f4e79')
+C_BLUE = colors.HexColor('#2f5f8f')
+C_BG = colors.HexColor('#f8f9fa')
+C_GREEN = colors.HexColor('#228B22')
+C_CODE_BG = colors.HexColor('#f5f5f5')
+C_CODE_FG = colors.HexColor('#2d5016')
+C_GREY = colors.HexColor('#666666')
+
+# Paragraph styles are built once per process and shared by every report
+
+# Section heading style - improved spacing
+heading_style = ParagraphStyle(
+    'SectionHeading',
+    fontSize=18,  # Slightly larger
+    spaceAfter=18,
+    spaceBefore=30,
+    textColor=C_NAVY,
+    fontName='Helvetica-Bold',
+    leading=20,
+    keepWithNext=True  # Keep with following content
+)
+
+# Subheading style - improved spacing
+subheading_style = ParagraphStyle(
+    'SubHeading',
+    fontSize=15,  # Slightly larger
+    spaceAfter=12,
+    spaceBefore=20,
+    textColor=C_BLUE,
+    fontName='Helvetica-Bold',
+    leading=17,
+    keepWithNext=True  # Keep with following content
+)
+
+# Normal text style - improved spacing
+normal_style = ParagraphStyle(
+    'CustomNormal',
+    fontSize=11,
+    spaceAfter=10,  # Increased spacing
+    spaceBefore=5,
+    fontName='Helvetica',
+    leading=14,  # Better line spacing
+    alignment=0
+)
+
+# Bullet style - improved
+bullet_style = ParagraphStyle(
+    'BulletStyle',
+    fontSize=11,
+    spaceAfter=6,  # Better spacing
+    spaceBefore=3,
+    leftIndent=20,  # Better indentation
+    bulletIndent=10,
+    bulletText='\u2022',  # Drawn by the style, hanging in the indent
+    bulletFontName='Helvetica',
+    fontName='Helvetica',
+    leading=14
+)
+
+# Table cell styles - improved
+table_cell_style = ParagraphStyle(
+    'TableCell',
+    fontSize=10,
+    fontName='Helvetica',
+    leading=13,  # Better line spacing
+    alignment=0
+)
+
+table_header_style = ParagraphStyle(
+    'TableHeader',
+    fontSize=11,  # Slightly larger
+    fontName='Helvetica-Bold',
+    leading=14,
+    alignment=1,
+    textColor=colors.white
+)
+
+# Code style for CLI commands - improved
+code_style = ParagraphStyle(
+    'CodeStyle',
+    fontSize=9,
+    fontName='Courier',
+    leading=12,  # Better spacing
+    textColor=C_CODE_FG,
+    leftIndent=15,
+    backColor=C_CODE_BG  # Light background
+)
+
+# Report footer style
+footer_style = ParagraphStyle(
+    'Footer',
+    fontSize=11,
+    alignment=1,
+    textColor=C_NAVY,
+    fontName='Helvetica',
+    leading=14
+)
+
+# Repeated cell text (masks, "✓ SUCCESS", header labels) shares one Paragraph,
+# so its markup is parsed once per report instead of once per cell
+_PARAGRAPH_STYLES = {'cell': table_cell_style, 'hdr': table_header_style}
+
+@lru_cache(maxsize=4096)
+def _p(text, style_key):
+    return Paragraph(text, _PARAGRAPH_STYLES[style_key])
+
+@lru_cache(maxsize=256)
+def _bullet_markup(label, text, style):
+    """Escape and parse a bold-label bullet once per process"""
+    markup = f"<b>{escape(label)}:</b> {escape(text)}"
+    return markup, Paragraph(markup, style).frags
+
+def _make_bullet(label, text, style):
+    """Bullet Paragraph built from the cached parse"""
+    # Platypus marks flowables as it lays them out, so only the parsed
+    # fragments are shared; each build gets its own Paragraph
+    markup, frags = _bullet_markup(label, text, style)
+    return Paragraph(markup, style, frags=frags)
+
+# Navy header row and grid shared by the report's data tables
+_HEADER_TABLE_STYLE = TableStyle((
+    ('BACKGROUND', (0, 0), (-1, 0), C_NAVY),
+    ('GRID', (0, 0), (-1, -1), 1, C_NAVY),
+    ('ALIGN', (0, 0), (-1, 0), 'CENTER')
+))
+
+_HEALTH_TABLE_STYLE = TableStyle((
+    ('FONT', (0, 1), (-1, -1), 'Helvetica', 10, 13),  # Plain-text body cells
+    ('BACKGROUND', (0, 1), (-1, -1), C_BG),  # Light background
+    ('ALIGN', (0, 1), (-1, -1), 'LEFT'),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+    ('TOPPADDING', (0, 0), (-1, -1), 8),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+    ('LEFTPADDING', (0, 0), (-1, -1), 8),
+    ('RIGHTPADDING', (0, 0), (-1, -1), 8)
+), parent=_HEADER_TABLE_STYLE)
+
+_ARCH_TABLE_STYLE = TableStyle((
+    ('BACKGROUND', (0, 1), (-1, -1), colors.white),
+    ('ALIGN', (0, 1), (-1, -1), 'LEFT'),
+    ('VALIGN', (0, 0), (-1, -1), 'TOP'),  # Changed to TOP for better alignment
+    ('TOPPADDING', (0, 0), (-1, -1), 10),  # Increased padding
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
+    ('LEFTPADDING', (0, 0), (-1, -1), 8),
+    ('RIGHTPADDING', (0, 0), (-1, -1), 8)
+), parent=_HEADER_TABLE_STYLE)
+
+_IP_TABLE_STYLE = TableStyle((
+    ('FONT', (0, 1), (-1, -1), 'Helvetica', 10, 13),  # Plain-text body cells
+    ('BACKGROUND', (0, 1), (-1, -1), C_BG),
+    ('ALIGN', (0, 1), (0, -1), 'LEFT'),
+    ('ALIGN', (1, 1), (-1, -1), 'CENTER'),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+    ('TOPPADDING', (0, 0), (-1, -1), 8),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+    ('LEFTPADDING', (0, 0), (-1, -1), 6),
+    ('RIGHTPADDING', (0, 0), (-1, -1), 6)
+), parent=_HEADER_TABLE_STYLE)
+
+_PC_TABLE_STYLE = TableStyle((
+    ('FONT', (0, 1), (-1, -1), 'Helvetica', 10, 13),  # Plain-text body cells
+    ('BACKGROUND', (0, 1), (-1, -1), colors.white),
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+    ('TOPPADDING', (0, 0), (-1, -1), 10),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
+    ('LEFTPADDING', (0, 0), (-1, -1), 6),
+    ('RIGHTPADDING', (0, 0), (-1, -1), 6)
+), parent=_HEADER_TABLE_STYLE)
+
+_TEST_TABLE_STYLE = TableStyle((
+    ('BACKGROUND', (0, 1), (-1, -1), C_BG),
+    ('ALIGN', (0, 1), (3, -1), 'CENTER'),
+    ('ALIGN', (4, 1), (4, -1), 'LEFT'),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+    ('TOPPADDING', (0, 0), (-1, -1), 8),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+    ('LEFTPADDING', (0, 0), (-1, -1), 6),
+    ('RIGHTPADDING', (0, 0), (-1, -1), 6),
+    ('FONTNAME', (3, 1), (3, -1), 'Helvetica-Bold'),
+    ('TEXTCOLOR', (3, 1), (3, -1), C_GREEN)
+), parent=_HEADER_TABLE_STYLE)
+
+_STATS_TABLE_STYLE = TableStyle((
+    ('FONT', (0, 1), (0, -1), 'Helvetica', 10, 13),  # Plain-text metric names
+    ('BACKGROUND', (0, 1), (-1, -1), C_BG),
+    ('ALIGN', (0, 1), (-1, -1), 'LEFT'),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+    ('TOPPADDING', (0, 0), (-1, -1), 10),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
+    ('LEFTPADDING', (0, 0), (-1, -1), 8),
+    ('RIGHTPADDING', (0, 0), (-1, -1), 8)
+), parent=_HEADER_TABLE_STYLE)
+
+# Table column widths
+_COVER_COLS = (2.2*inch, 3.8*inch)
+_HEALTH_COLS = (3*inch, 3*inch)
+_ARCH_COLS = (2*inch, 1.8*inch, 2.2*inch)
+_IP_COLS = (1.2*inch, 1.3*inch, 1.2*inch, 1.2*inch, 1.1*inch)
+_PC_COLS = (1*inch, 1.3*inch, 1.3*inch, 1.3*inch, 1.1*inch)
+_TEST_COLS = (1.1*inch, 1*inch, 1.2*inch, 0.9*inch, 1.8*inch)
+_STATS_COLS = (2.5*inch, 3.5*inch)
+
+# Cover page info box rows
+COVER_INFO = [
+    ("Student Name:", "Harshal Sakpal"),
+    ("Institution:", "A.P Shah Institute of Technology"),
+    ("Program:", "Cisco Virtual Internship Program 2025"),
+    ("Project Title:", "Enterprise Network Topology with Static Routing"),
+    ("Submission Date:", "August 22, 2025"),
+    ("Platform:", "Cisco Packet Tracer"),
+    ("Project File:", "new.pkt")
+]
+
+_COVER_ROW_HEIGHT = 34
+
+def _draw_cover(canvas, doc):
+    """Draw the fixed cover page straight onto the first page's canvas"""
+    page_width, page_height = doc.pagesize
+    center_x = page_width / 2
+    top = page_height - doc.topMargin
+    
+    canvas.saveState()
+    
+    # Title and subtitle
+    canvas.setFillColor(C_NAVY)
+    canvas.setFont('Helvetica-Bold', 26)
+    canvas.drawCentredString(center_x, top - 92, "Enterprise Network Implementation")
+    canvas.setFillColor(C_BLUE)
+    canvas.setFont('Helvetica', 20)
+    canvas.drawCentredString(center_x, top - 141, "Cisco VIP 2025")
+    
+    # Project details box: navy label column, white value column
+    label_width, value_width = _COVER_COLS
+    box_width = label_width + value_width
+    box_height = _COVER_ROW_HEIGHT * len(COVER_INFO)
+    box_x = center_x - box_width / 2
+    box_top = top - 220
+    box_y = box_top - box_height
+    
+    canvas.setFillColor(C_NAVY)
+    canvas.rect(box_x, box_y, label_width, box_height, stroke=0, fill=1)
+    canvas.setFillColor(colors.white)
+    canvas.rect(box_x + label_width, box_y, value_width, box_height, stroke=0, fill=1)
+    
+    for row, (label, value) in enumerate(COVER_INFO):
+        baseline = box_top - row * _COVER_ROW_HEIGHT - 21
+        canvas.setFillColor(colors.white)
+        canvas.setFont('Helvetica-Bold', 11)
+        canvas.drawCentredString(box_x + label_width / 2, baseline, label)
+        canvas.setFillColor(colors.black)
+        canvas.setFont('Helvetica', 10)
+        canvas.drawString(box_x + label_width + 8, baseline, value)
+    
+    canvas.setStrokeColor(C_NAVY)
+    canvas.setLineWidth(1.5)
+    canvas.setLineCap(1)
+    canvas.setLineJoin(1)
+    canvas.rect(box_x, box_y, box_width, box_height, stroke=1, fill=0)
+    for row in range(1, len(COVER_INFO)):
+        row_y = box_top - row * _COVER_ROW_HEIGHT
+        canvas.line(box_x, row_y, box_x + box_width, row_y)
+    canvas.line(box_x + label_width, box_y, box_x + label_width, box_top)
     
-    # Code style for CLI commands - improved
-    code_style = ParagraphStyle(
-        'CodeStyle',
-        parent=styles['Normal'],
-        fontSize=9,
-        fontName='Courier',
-        leading=12,  # Better spacing
-        textColor=colors.HexColor('#2d5016'),
-        leftIndent=15,
-        spaceAfter=5,
-        spaceBefore=2,
-        backColor=colors.HexColor('#f5f5f5')  # Light background
-    )
+    # Cover page footer
+    canvas.setFillColor(C_GREY)
+    canvas.setFont('Helvetica-Oblique', 12)
+    canvas.drawCentredString(center_x, top - 550, "Professional network implementation demonstrating static routing,")
+    canvas.drawCentredString(center_x, top - 562, "inter-site connectivity, and enterprise-level network design")
     
-    story = []
+    canvas.restoreState()
+
+def _generated_at() -> str:
+    """Timestamp shown in the report footer"""
+    return datetime.now().strftime('%B %d, %Y at %H:%M')
+
+def _report_story(generated_at):
+    """Yield the report flowables in page order"""
     
     # ===========================================
-    # 1. COVER PAGE - Keep together
+    # 1. COVER PAGE - drawn on the canvas by _draw_cover
     # ===========================================
     
-    cover_content = []
-    cover_content.append(Spacer(1, 60))
-    cover_content.append(Paragraph("Enterprise Network Implementation", cover_title_style))
-    cover_content.append(Paragraph("Cisco VIP 2025", cover_subtitle_style))
-    cover_content.append(Spacer(1, 40))
-    
-    # Project details box - improved styling
-    cover_info = [
-        [Paragraph("<b>Student Name:</b>", table_header_style), 
-         Paragraph("Harshal Sakpal", table_cell_style)],
-        [Paragraph("<b>Institution:</b>", table_header_style), 
-         Paragraph("A.P Shah Institute of Technology", table_cell_style)],
-        [Paragraph("<b>Program:</b>", table_header_style), 
-         Paragraph("Cisco Virtual Internship Program 2025", table_cell_style)],
-        [Paragraph("<b>Project Title:</b>", table_header_style), 
-         Paragraph("Enterprise Network Topology with Static Routing", table_cell_style)],
-        [Paragraph("<b>Submission Date:</b>", table_header_style), 
-         Paragraph("August 22, 2025", table_cell_style)],
-        [Paragraph("<b>Platform:</b>", table_header_style), 
-         Paragraph("Cisco Packet Tracer", table_cell_style)],
-        [Paragraph("<b>Project File:</b>", table_header_style), 
-         Paragraph("new.pkt", table_cell_style)]
-    ]
-    
-    cover_table = Table(cover_info, colWidths=[2.2*inch, 3.8*inch])
-    cover_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#1f4e79')),  # Darker header
-        ('BACKGROUND', (1, 0), (1, -1), colors.white),
-        ('GRID', (0, 0), (-1, -1), 1.5, colors.HexColor('#1f4e79')),  # Thicker border
-        ('ALIGN', (0, 0), (0, -1), 'CENTER'),
-        ('ALIGN', (1, 0), (1, -1), 'LEFT'),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ('TOPPADDING', (0, 0), (-1, -1), 10),  # Increased padding
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
-        ('LEFTPADDING', (0, 0), (-1, -1), 8),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 8)
-    ]))
-    
-    cover_content.append(cover_table)
-    cover_content.append(Spacer(1, 80))
-    
-    # Cover page footer
-    cover_content.append(Paragraph(
-        "<i>Professional network implementation demonstrating static routing,<br/>"
-        "inter-site connectivity, and enterprise-level network design</i>",
-        ParagraphStyle('CoverFooter', parent=styles['Normal'], fontSize=12, 
-                      alignment=1, textColor=colors.HexColor('#666666'), 
-                      fontName='Helvetica-Oblique')
-    ))
-    
-    # Keep cover page together
-    story.append(KeepTogether(cover_content))
-    story.append(PageBreak())
+    yield PageBreak()
     
     # ===========================================
     # 2. EXECUTIVE SUMMARY - Better organization
     # ===========================================
     
-    story.append(Paragraph("Executive Summary", heading_style))
+    yield Paragraph("Executive Summary", heading_style)
     
-    # Keep executive summary paragraphs together
-    exec_summary = []
-    exec_summary.append(Paragraph(
+    # Executive summary paragraphs
+    yield Paragraph(
         "This project demonstrates the successful implementation of a professional enterprise "
         "network infrastructure using Cisco ISR 1941 routers and Catalyst switches. The network "
         "features two geographically distributed sites interconnected via static routing, providing "
         "reliable and secure inter-site communication for distributed business operations.",
         normal_style
-    ))
+    )
     
-    exec_summary.append(Paragraph(
+    yield Paragraph(
         "The implementation showcases advanced networking concepts including hierarchical network "
         "design, proper IP addressing schemes, static route configuration, and comprehensive "
         "network validation procedures. All connectivity tests achieved 100% success rates, "
         "demonstrating robust network functionality and professional-level configuration standards.",
         normal_style
-    ))
-    
-    story.append(KeepTogether(exec_summary))
-    story.append(Spacer(1, 20))
+    )
+    yield Spacer(1, 20)
     
-    # Achievements section - keep together
+    # Achievements section
     achievements_content = []
     achievements_content.append(Paragraph("Key Project Achievements", subheading_style))
     
-    achievements = [
-        "Network Topology: Successfully designed and implemented 2-router enterprise topology with 4 endpoint devices",
-        "Static Routing: Configured bidirectional static routes enabling seamless inter-site communication",
-        "Connectivity Validation: Achieved 100% end-to-end network connectivity across both local and remote networks", 
-        "Professional Testing: Demonstrated comprehensive network troubleshooting using multiple validation methodologies",
-        "Scalable Architecture: Created enterprise-grade network foundation suitable for production deployment",
-        "Documentation Standards: Produced professional technical documentation meeting industry standards"
-    ]
+    for label, text in ACHIEVEMENTS:
+        achievements_content.append(_make_bullet(label, text, bullet_style))
     
-    for achievement in achievements:
-        achievements_content.append(Paragraph(f"• <b>{achievement.split(':')[0]}:</b> {achievement.split(':', 1)[1]}", bullet_style))
-    
-    story.append(KeepTogether(achievements_content))
-    story.append(Spacer(1, 25))
-    
-    # Network Health Summary - keep together with title
-    health_section = []
-    health_section.append(Paragraph("Network Performance Summary", subheading_style))
-    
-    health_data = [
-        [Paragraph("<b>Performance Metric</b>", table_header_style), 
-         Paragraph("<b>Achievement</b>", table_header_style)],
-        [Paragraph("End-to-End Connectivity", table_cell_style), 
-         Paragraph("✓ 100% Success Rate", table_cell_style)],
-        [Paragraph("Local Network Tests", table_cell_style), 
-         Paragraph("✓ All Tests Passed", table_cell_style)],
-        [Paragraph("Inter-Site Routing", table_cell_style), 
-         Paragraph("✓ Fully Functional", table_cell_style)],
-        [Paragraph("Network Convergence", table_cell_style), 
-         Paragraph("✓ Optimal Performance", table_cell_style)],
-        [Paragraph("Configuration Validation", table_cell_style), 
-         Paragraph("✓ No Issues Detected", table_cell_style)]
-    ]
+    yield KeepTogether(achievements_content)
+    yield Spacer(1, 25)
+    
+    # Network Health Summary
+    yield Paragraph("Network Performance Summary", subheading_style)
     
-    health_table = Table(health_data, colWidths=[3*inch, 3*inch])
-    health_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1f4e79')),  # Professional blue header
-        ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#f8f9fa')),  # Light background
-        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#1f4e79')),
-        ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
-        ('ALIGN', (0, 1), (-1, -1), 'LEFT'),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ('TOPPADDING', (0, 0), (-1, -1), 8),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-        ('LEFTPADDING', (0, 0), (-1, -1), 8),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 8)
-    ]))
-    
-    health_section.append(health_table)
-    story.append(KeepTogether(health_section))
-    story.append(PageBreak())
+    health_data = [[_p(f"<b>{header}</b>", 'hdr') for header in HEALTH_HEADERS]]
+    health_data += [list(row) for row in HEALTH_ROWS]
+    
+    health_table = Table(health_data, colWidths=_HEALTH_COLS)
+    health_table.setStyle(_HEALTH_TABLE_STYLE)
+    
+    yield health_table
+    yield PageBreak()
     
     # ===========================================
     # 3. NETWORK ARCHITECTURE - Better organization
     # ===========================================
     
-    story.append(Paragraph("Network Architecture & Design", heading_style))
+    yield Paragraph("Network Architecture & Design", heading_style)
     
-    # Architecture overview - keep together
-    arch_overview = []
-    arch_overview.append(Paragraph(
+    # Architecture overview
+    yield Paragraph(
         "The enterprise network architecture follows a hierarchical design model with two distinct "
         "sites connected via WAN infrastructure. This design ensures scalability, reliability, and "
         "efficient traffic flow between distributed locations.",
         normal_style
-    ))
+    )
     
-    arch_overview.append(Paragraph("Network Topology Overview", subheading_style))
-    arch_overview.append(Paragraph(
+    yield Paragraph("Network Topology Overview", subheading_style)
+    yield Paragraph(
         "The topology displays a professional dual-site network with Router1 and Router2 as core devices, "
         "each serving their respective local area networks through dedicated switches. The WAN connection "
         "provides secure inter-site communication via high-speed serial interfaces.",
         normal_style
-    ))
+    )
+    yield Spacer(1, 20)
     
-    story.append(KeepTogether(arch_overview))
-    story.append(Spacer(1, 20))
-    
-    # Network Architecture Specifications - keep together
-    arch_specs_section = []
-    arch_specs_section.append(Paragraph("Network Architecture Specifications", subheading_style))
-    
-    arch_data = [
-        [Paragraph("<b>Network Component</b>", table_header_style), 
-         Paragraph("<b>IP Specification</b>", table_header_style), 
-         Paragraph("<b>Technical Details</b>", table_header_style)],
-        [Paragraph("Site A LAN Network", table_cell_style), 
-         Paragraph("192.168.10.0/24", table_cell_style), 
-         Paragraph("Router1 + Switch1 + PC1/PC2<br/>254 available host addresses", table_cell_style)],
-        [Paragraph("Site B LAN Network", table_cell_style), 
-         Paragraph("192.168.20.0/24", table_cell_style), 
-         Paragraph("Router2 + Switch2 + PC3/PC4<br/>254 available host addresses", table_cell_style)],
-        [Paragraph("WAN Connection Link", table_cell_style), 
-         Paragraph("10.0.0.0/30", table_cell_style), 
-         Paragraph("Point-to-point serial connection<br/>2 usable host addresses", table_cell_style)],
-        [Paragraph("Routing Implementation", table_cell_style), 
-         Paragraph("Static Routing", table_cell_style), 
-         Paragraph("Manually configured routes<br/>Predictable and secure path selection", table_cell_style)],
-        [Paragraph("Hardware Infrastructure", table_cell_style), 
-         Paragraph("Cisco Enterprise Class", table_cell_style), 
-         Paragraph("ISR 1941 Routers<br/>Catalyst Managed Switches", table_cell_style)]
-    ]
+    # Network Architecture Specifications
+    yield Paragraph("Network Architecture Specifications", subheading_style)
     
-    arch_table = Table(arch_data, colWidths=[2*inch, 1.8*inch, 2.2*inch])
-    arch_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1f4e79')),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.white),
-        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#1f4e79')),
-        ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
-        ('ALIGN', (0, 1), (-1, -1), 'LEFT'),
-        ('VALIGN', (0, 0), (-1, -1), 'TOP'),  # Changed to TOP for better alignment
-        ('TOPPADDING', (0, 0), (-1, -1), 10),  # Increased padding
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
-        ('LEFTPADDING', (0, 0), (-1, -1), 8),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 8)
-    ]))
-    
-    arch_specs_section.append(arch_table)
-    story.append(KeepTogether(arch_specs_section))
-    story.append(Spacer(1, 25))
-    
-    # IP Addressing Scheme - keep together
-    ip_section = []
-    ip_section.append(Paragraph("Comprehensive IP Addressing Scheme", subheading_style))
-    
-    ip_data = [
-        [Paragraph("<b>Network Device</b>", table_header_style), 
-         Paragraph("<b>Interface Type</b>", table_header_style), 
-         Paragraph("<b>IP Address</b>", table_header_style), 
-         Paragraph("<b>Subnet Mask</b>", table_header_style),
-         Paragraph("<b>Network Role</b>", table_header_style)],
-        [Paragraph("Router1", table_cell_style), 
-         Paragraph("GigabitEthernet0/0", table_cell_style), 
-         Paragraph("192.168.10.1", table_cell_style), 
-         Paragraph("255.255.255.0", table_cell_style),
-         Paragraph("Site A Gateway", table_cell_style)],
-        [Paragraph("Router1", table_cell_style), 
-         Paragraph("Serial0/0/0", table_cell_style), 
-         Paragraph("10.0.0.1", table_cell_style), 
-         Paragraph("255.255.255.252", table_cell_style),
-         Paragraph("WAN Endpoint", table_cell_style)],
-        [Paragraph("Router2", table_cell_style), 
-         Paragraph("GigabitEthernet0/0", table_cell_style), 
-         Paragraph("192.168.20.1", table_cell_style), 
-         Paragraph("255.255.255.0", table_cell_style),
-         Paragraph("Site B Gateway", table_cell_style)],
-        [Paragraph("Router2", table_cell_style), 
-         Paragraph("Serial0/0/0", table_cell_style), 
-         Paragraph("10.0.0.2", table_cell_style), 
-         Paragraph("255.255.255.252", table_cell_style),
-         Paragraph("WAN Endpoint", table_cell_style)],
-        [Paragraph("PC1 (Site A)", table_cell_style), 
-         Paragraph("FastEthernet0", table_cell_style), 
-         Paragraph("192.168.10.10", table_cell_style), 
-         Paragraph("255.255.255.0", table_cell_style),
-         Paragraph("End Device", table_cell_style)],
-        [Paragraph("PC2 (Site A)", table_cell_style), 
-         Paragraph("FastEthernet0", table_cell_style), 
-         Paragraph("192.168.10.11", table_cell_style), 
-         Paragraph("255.255.255.0", table_cell_style),
-         Paragraph("End Device", table_cell_style)],
-        [Paragraph("PC3 (Site B)", table_cell_style), 
-         Paragraph("FastEthernet0", table_cell_style), 
-         Paragraph("192.168.20.10", table_cell_style), 
-         Paragraph("255.255.255.0", table_cell_style),
-         Paragraph("End Device", table_cell_style)],
-        [Paragraph("PC4 (Site B)", table_cell_style), 
-         Paragraph("FastEthernet0", table_cell_style), 
-         Paragraph("192.168.20.11", table_cell_style), 
-         Paragraph("255.255.255.0", table_cell_style),
-         Paragraph("End Device", table_cell_style)]
-    ]
+    arch_data = [[_p(f"<b>{header}</b>", 'hdr') for header in ARCH_HEADERS]]
+    arch_data += [[_p(cell, 'cell') for cell in row] for row in ARCH_ROWS]
     
-    ip_table = Table(ip_data, colWidths=[1.2*inch, 1.3*inch, 1.2*inch, 1.2*inch, 1.1*inch])
-    ip_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1f4e79')),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#f8f9fa')),
-        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#1f4e79')),
-        ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
-        ('ALIGN', (0, 1), (0, -1), 'LEFT'),
-        ('ALIGN', (1, 1), (-1, -1), 'CENTER'),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ('TOPPADDING', (0, 0), (-1, -1), 8),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-        ('LEFTPADDING', (0, 0), (-1, -1), 6),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 6)
-    ]))
-    
-    ip_section.append(ip_table)
-    story.append(KeepTogether(ip_section))
-    story.append(PageBreak())
+    arch_table = Table(arch_data, colWidths=_ARCH_COLS)
+    arch_table.setStyle(_ARCH_TABLE_STYLE)
+    
+    yield arch_table
+    yield Spacer(1, 25)
+    
+    # IP Addressing Scheme
+    yield Paragraph("Comprehensive IP Addressing Scheme", subheading_style)
+    
+    ip_data = [[_p(f"<b>{header}</b>", 'hdr') for header in IP_HEADERS]]
+    ip_data += [list(row) for row in IP_ROWS]
+    
+    ip_table = LongTable(ip_data, colWidths=_IP_COLS, repeatRows=1)
+    ip_table.setStyle(_IP_TABLE_STYLE)
+    
+    yield ip_table
+    yield PageBreak()
     
     # ===========================================
     # 4. IMPLEMENTATION DETAILS - Better structured
     # ===========================================
     
-    story.append(Paragraph("Implementation Details", heading_style))
+    yield Paragraph("Implementation Details", heading_style)
     
     # Implementation overview
-    impl_overview = []
-    impl_overview.append(Paragraph(
+    yield Paragraph(
         "The network implementation followed a systematic approach using Cisco best practices "
         "for enterprise network deployment. Each phase was carefully executed to ensure optimal "
         "performance, security, and scalability of the final network infrastructure.",
         normal_style
-    ))
-    
-    story.append(KeepTogether(impl_overview))
-    story.append(Spacer(1, 20))
+    )
+    yield Spacer(1, 20)
     
-    # Router Configuration Summary - keep sections together
+    # Router Configuration Summary
     router1_section = []
     router1_section.append(Paragraph("Router1 Configuration Details", subheading_style))
     router1_section.append(Paragraph("Core Site A Infrastructure Configuration:", normal_style))
     
-    router1_configs = [
-        "LAN Interface: GigabitEthernet0/0 configured with IP 192.168.10.1/24 serving as local gateway",
-        "WAN Interface: Serial0/0/0 configured with IP 10.0.0.1/30 at 64000 bps for inter-site connectivity",
-        "Static Route: Destination 192.168.20.0/24 via next-hop 10.0.0.2 for Site B network access",
-        "Interface Status: All interfaces activated with proper duplex and speed configuration",
-        "Security: Console and VTY access configured with appropriate authentication"
-    ]
-    
-    for config in router1_configs:
-        parts = config.split(': ', 1)
-        if len(parts) == 2:
-            router1_section.append(Paragraph(f"• <b>{parts[0]}:</b> {parts[1]}", bullet_style))
-        else:
-            router1_section.append(Paragraph(f"• {config}", bullet_style))
+    for label, text in ROUTER1_CONFIGS:
+        router1_section.append(_make_bullet(label, text, bullet_style))
     
-    story.append(KeepTogether(router1_section))
-    story.append(Spacer(1, 15))
+    yield KeepTogether(router1_section)
+    yield Spacer(1, 15)
     
     router2_section = []
     router2_section.append(Paragraph("Router2 Configuration Details", subheading_style))
     router2_section.append(Paragraph("Core Site B Infrastructure Configuration:", normal_style))
     
-    router2_configs = [
-        "LAN Interface: GigabitEthernet0/0 configured with IP 192.168.20.1/24 serving as local gateway",
-        "WAN Interface: Serial0/0/0 configured with IP 10.0.0.2/30 at 64000 bps for inter-site connectivity",
-        "Static Route: Destination 192.168.10.0/24 via next-hop 10.0.0.1 for Site A network access",
-        "Interface Status: All interfaces operational with optimized performance settings",
-        "Redundancy: Configuration backup and startup-config synchronization implemented"
-    ]
-    
-    for config in router2_configs:
-        parts = config.split(': ', 1)
-        if len(parts) == 2:
-            router2_section.append(Paragraph(f"• <b>{parts[0]}:</b> {parts[1]}", bullet_style))
-        else:
-            router2_section.append(Paragraph(f"• {config}", bullet_style))
+    for label, text in ROUTER2_CONFIGS:
+        router2_section.append(_make_bullet(label, text, bullet_style))
     
-    story.append(KeepTogether(router2_section))
-    story.append(Spacer(1, 20))
+    yield KeepTogether(router2_section)
+    yield Spacer(1, 20)
     
-    # CLI Commands - keep together
+    # CLI Commands
     cli_section = []
     cli_section.append(Paragraph("Essential CLI Configuration Commands", subheading_style))
     cli_section.append(Paragraph("Professional configuration sequence used for both routers:", normal_style))
@@ -521,149 +601,53 @@ def create_improved_cisco_vip_report():
         "Router1# copy running-config startup-config"
     ]
     
-    for cmd in cli_commands:
-        cli_section.append(Paragraph(cmd, code_style))
+    # One preformatted block instead of a Paragraph per command line
+    cli_section.append(XPreformatted("\n".join(cli_commands), code_style))
     
-    story.append(KeepTogether(cli_section))
-    story.append(Spacer(1, 20))
+    yield KeepTogether(cli_section)
+    yield Spacer(1, 20)
     
     # PC Configuration - comprehensive table
-    pc_section = []
-    pc_section.append(Paragraph("End Device Network Configuration", subheading_style))
-    
-    pc_data = [
-        [Paragraph("<b>Device</b>", table_header_style), 
-         Paragraph("<b>IP Address</b>", table_header_style), 
-         Paragraph("<b>Subnet Mask</b>", table_header_style), 
-         Paragraph("<b>Default Gateway</b>", table_header_style),
-         Paragraph("<b>Network Segment</b>", table_header_style)],
-        [Paragraph("PC1", table_cell_style), 
-         Paragraph("192.168.10.10", table_cell_style), 
-         Paragraph("255.255.255.0", table_cell_style), 
-         Paragraph("192.168.10.1", table_cell_style),
-         Paragraph("Site A LAN", table_cell_style)],
-        [Paragraph("PC2", table_cell_style), 
-         Paragraph("192.168.10.11", table_cell_style), 
-         Paragraph("255.255.255.0", table_cell_style), 
-         Paragraph("192.168.10.1", table_cell_style),
-         Paragraph("Site A LAN", table_cell_style)],
-        [Paragraph("PC3", table_cell_style), 
-         Paragraph("192.168.20.10", table_cell_style), 
-         Paragraph("255.255.255.0", table_cell_style), 
-         Paragraph("192.168.20.1", table_cell_style),
-         Paragraph("Site B LAN", table_cell_style)],
-        [Paragraph("PC4", table_cell_style), 
-         Paragraph("192.168.20.11", table_cell_style), 
-         Paragraph("255.255.255.0", table_cell_style), 
-         Paragraph("192.168.20.1", table_cell_style),
-         Paragraph("Site B LAN", table_cell_style)]
-    ]
+    yield Paragraph("End Device Network Configuration", subheading_style)
     
-    pc_table = Table(pc_data, colWidths=[1*inch, 1.3*inch, 1.3*inch, 1.3*inch, 1.1*inch])
-    pc_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1f4e79')),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.white),
-        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#1f4e79')),
-        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ('TOPPADDING', (0, 0), (-1, -1), 10),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
-        ('LEFTPADDING', (0, 0), (-1, -1), 6),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 6)
-    ]))
-    
-    pc_section.append(pc_table)
-    story.append(KeepTogether(pc_section))
-    story.append(PageBreak())
+    pc_data = [[_p(f"<b>{header}</b>", 'hdr') for header in PC_HEADERS]]
+    pc_data += [list(row) for row in PC_ROWS]
+    
+    pc_table = Table(pc_data, colWidths=_PC_COLS)
+    pc_table.setStyle(_PC_TABLE_STYLE)
+    
+    yield pc_table
+    yield PageBreak()
     
     # ===========================================
     # 5. TESTING & VALIDATION - Better organized
     # ===========================================
     
-    story.append(Paragraph("Network Testing & Validation", heading_style))
+    yield Paragraph("Network Testing & Validation", heading_style)
     
     # Testing overview
-    testing_overview = []
-    testing_overview.append(Paragraph(
+    yield Paragraph(
         "Comprehensive network validation was performed using multiple testing methodologies to "
         "ensure complete functionality across all network segments. Testing protocols included "
         "connectivity verification, routing validation, and performance analysis using both "
         "real-time and simulation modes.",
         normal_style
-    ))
-    
-    story.append(KeepTogether(testing_overview))
-    story.append(Spacer(1, 20))
+    )
+    yield Spacer(1, 20)
     
     # Connectivity Test Results - comprehensive table
-    test_results_section = []
-    test_results_section.append(Paragraph("Comprehensive Connectivity Test Results", subheading_style))
-    
-    test_data = [
-        [Paragraph("<b>Test Category</b>", table_header_style), 
-         Paragraph("<b>Source Device</b>", table_header_style), 
-         Paragraph("<b>Target Address</b>", table_header_style), 
-         Paragraph("<b>Test Result</b>", table_header_style), 
-         Paragraph("<b>Technical Analysis</b>", table_header_style)],
-        [Paragraph("Local Gateway", table_cell_style), 
-         Paragraph("PC1", table_cell_style), 
-         Paragraph("192.168.10.1", table_cell_style), 
-         Paragraph("✓ SUCCESS", table_cell_style), 
-         Paragraph("Direct gateway connectivity verified", table_cell_style)],
-        [Paragraph("Same Subnet", table_cell_style), 
-         Paragraph("PC1", table_cell_style), 
-         Paragraph("192.168.10.11", table_cell_style), 
-         Paragraph("✓ SUCCESS", table_cell_style), 
-         Paragraph("Layer 2 switching operational", table_cell_style)],
-        [Paragraph("Remote Gateway", table_cell_style), 
-         Paragraph("PC1", table_cell_style), 
-         Paragraph("192.168.20.1", table_cell_style), 
-         Paragraph("✓ SUCCESS", table_cell_style), 
-         Paragraph("Static routing functional", table_cell_style)],
-        [Paragraph("End-to-End", table_cell_style), 
-         Paragraph("PC1", table_cell_style), 
-         Paragraph("192.168.20.10", table_cell_style), 
-         Paragraph("✓ SUCCESS", table_cell_style), 
-         Paragraph("Complete network connectivity", table_cell_style)],
-        [Paragraph("Cross-Network", table_cell_style), 
-         Paragraph("PC2", table_cell_style), 
-         Paragraph("192.168.20.11", table_cell_style), 
-         Paragraph("✓ SUCCESS", table_cell_style), 
-         Paragraph("Bidirectional routing verified", table_cell_style)],
-        [Paragraph("Return Path", table_cell_style), 
-         Paragraph("PC3", table_cell_style), 
-         Paragraph("192.168.10.10", table_cell_style), 
-         Paragraph("✓ SUCCESS", table_cell_style), 
-         Paragraph("Symmetric routing confirmed", table_cell_style)],
-        [Paragraph("WAN Interface", table_cell_style), 
-         Paragraph("PC4", table_cell_style), 
-         Paragraph("10.0.0.1", table_cell_style), 
-         Paragraph("✓ SUCCESS", table_cell_style), 
-         Paragraph("WAN connectivity established", table_cell_style)]
-    ]
+    yield Paragraph("Comprehensive Connectivity Test Results", subheading_style)
+    
+    test_data = [[_p(f"<b>{header}</b>", 'hdr') for header in TEST_HEADERS]]
+    test_data += [[_p(cell, 'cell') for cell in row] for row in TEST_ROWS]
+    
+    test_table = LongTable(test_data, colWidths=_TEST_COLS, repeatRows=1)
+    test_table.setStyle(_TEST_TABLE_STYLE)
     
-    test_table = Table(test_data, colWidths=[1.1*inch, 1*inch, 1.2*inch, 0.9*inch, 1.8*inch])
-    test_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1f4e79')),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#f8f9fa')),
-        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#1f4e79')),
-        ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
-        ('ALIGN', (0, 1), (3, -1), 'CENTER'),
-        ('ALIGN', (4, 1), (4, -1), 'LEFT'),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ('TOPPADDING', (0, 0), (-1, -1), 8),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-        ('LEFTPADDING', (0, 0), (-1, -1), 6),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 6),
-        ('FONTNAME', (3, 1), (3, -1), 'Helvetica-Bold'),
-        ('TEXTCOLOR', (3, 1), (3, -1), colors.HexColor('#228B22'))
-    ]))
-    
-    test_results_section.append(test_table)
-    story.append(KeepTogether(test_results_section))
-    story.append(Spacer(1, 25))
-    
-    # Simulation Analysis - keep together
+    yield test_table
+    yield Spacer(1, 25)
+    
+    # Simulation Analysis
     simulation_section = []
     simulation_section.append(Paragraph("Advanced Simulation Mode Analysis", subheading_style))
     simulation_section.append(Paragraph(
@@ -672,255 +656,200 @@ def create_improved_cisco_vip_report():
         normal_style
     ))
     
-    simulation_points = [
-        "Device Discovery: Simulation demonstrates proper network topology recognition and device identification",
-        "Packet Flow Analysis: Visual confirmation of routing path through Router1, WAN link, and Router2",
-        "Protocol Operations: Detailed ARP resolution, frame encapsulation, and routing table operations",
-        "Network Convergence: Realistic timing analysis showing proper network learning behavior",
-        "Layer Validation: Comprehensive Layer 2 switching and Layer 3 routing verification",
-        "Performance Metrics: Network latency and throughput analysis within acceptable parameters"
-    ]
-    
-    for point in simulation_points:
-        parts = point.split(': ', 1)
-        if len(parts) == 2:
-            simulation_section.append(Paragraph(f"• <b>{parts[0]}:</b> {parts[1]}", bullet_style))
-        else:
-            simulation_section.append(Paragraph(f"• {point}", bullet_style))
+    for label, text in SIMULATION_POINTS:
+        simulation_section.append(_make_bullet(label, text, bullet_style))
     
-    story.append(KeepTogether(simulation_section))
-    story.append(Spacer(1, 20))
+    yield KeepTogether(simulation_section)
+    yield Spacer(1, 20)
     
-    # Network Verification Evidence - keep together
+    # Network Verification Evidence
     evidence_section = []
     evidence_section.append(Paragraph("Technical Verification Documentation", subheading_style))
     
-    verification_evidence = [
-        "Configuration Validation: Complete running-config outputs showing proper interface and routing setup",
-        "Connectivity Evidence: Command-line ping results demonstrating successful network communication",
-        "ARP Resolution: MAC address learning and ARP table population across network segments",
-        "Routing Analysis: Static route functionality and proper path selection verification",
-        "Protocol Verification: Layer 2 and Layer 3 protocol operations confirmed through simulation",
-        "Performance Assessment: Network response times and packet delivery success rates documented"
-    ]
-    
-    for evidence in verification_evidence:
-        parts = evidence.split(': ', 1)
-        if len(parts) == 2:
-            evidence_section.append(Paragraph(f"• <b>{parts[0]}:</b> {parts[1]}", bullet_style))
-        else:
-            evidence_section.append(Paragraph(f"• {evidence}", bullet_style))
+    for label, text in VERIFICATION_EVIDENCE:
+        evidence_section.append(_make_bullet(label, text, bullet_style))
     
-    story.append(KeepTogether(evidence_section))
-    story.append(PageBreak())
+    yield KeepTogether(evidence_section)
+    yield PageBreak()
     
     # ===========================================
     # 6. CONCLUSION - Well-structured sections
     # ===========================================
     
-    story.append(Paragraph("Project Conclusion & Assessment", heading_style))
+    yield Paragraph("Project Conclusion & Assessment", heading_style)
     
     # Project Success Summary
-    success_section = []
-    success_section.append(Paragraph("Project Success Summary", subheading_style))
-    success_section.append(Paragraph(
+    yield Paragraph("Project Success Summary", subheading_style)
+    yield Paragraph(
         "This enterprise network implementation project has exceeded all defined objectives, "
         "demonstrating mastery of professional network design, implementation, and validation "
         "methodologies. The dual-site network topology provides a robust, scalable foundation "
         "for distributed business operations with guaranteed inter-site connectivity.",
         normal_style
-    ))
-    
-    story.append(KeepTogether(success_section))
-    story.append(Spacer(1, 20))
+    )
+    yield Spacer(1, 20)
     
-    # Objectives Achieved - keep together
+    # Objectives Achieved
     objectives_section = []
     objectives_section.append(Paragraph("Key Objectives Successfully Achieved", subheading_style))
     
-    objectives_achieved = [
-        "Network Design Excellence: Implemented hierarchical network architecture following Cisco best practices",
-        "Static Routing Mastery: Successfully configured bidirectional static routes enabling seamless communication",
-        "Complete Connectivity: Achieved 100% network connectivity validation across all test scenarios",
-        "Professional Standards: Demonstrated enterprise-level configuration and documentation practices",
-        "Scalability Foundation: Created infrastructure capable of supporting future expansion requirements",
-        "Performance Optimization: Delivered network solution with optimal routing and switching performance"
-    ]
-    
-    for objective in objectives_achieved:
-        parts = objective.split(': ', 1)
-        if len(parts) == 2:
-            objectives_section.append(Paragraph(f"• <b>{parts[0]}:</b> {parts[1]}", bullet_style))
-        else:
-            objectives_section.append(Paragraph(f"• {objective}", bullet_style))
+    for label, text in OBJECTIVES_ACHIEVED:
+        objectives_section.append(_make_bullet(label, text, bullet_style))
     
-    story.append(KeepTogether(objectives_section))
-    story.append(Spacer(1, 25))
+    yield KeepTogether(objectives_section)
+    yield Spacer(1, 25)
     
     # Technical Skills - comprehensive section
-    skills_section = []
-    skills_section.append(Paragraph("Professional Technical Skills Demonstrated", subheading_style))
-    skills_section.append(Paragraph(
+    yield CondPageBreak(2*inch)
+    yield Paragraph("Professional Technical Skills Demonstrated", subheading_style)
+    yield Paragraph(
         "This project showcases comprehensive networking competencies essential for enterprise "
         "network engineering roles, combining advanced theoretical knowledge with practical "
         "implementation expertise:",
         normal_style
-    ))
-    
-    technical_skills = [
-        "Cisco Router Configuration: Expert-level CLI-based configuration of ISR routers with advanced interface management",
-        "Static Routing Implementation: Professional configuration of static routes with next-hop and administrative distance",
-        "Network Architecture Design: Application of hierarchical design principles for enterprise-grade scalability",
-        "IP Addressing & VLSM: Efficient IP address space utilization with Variable Length Subnet Masking",
-        "Layer 2 Technologies: Advanced understanding of switching operations and VLAN implementation concepts", 
-        "Network Troubleshooting: Systematic diagnostic approach using multiple validation and testing methodologies",
-        "Protocol Analysis: Deep understanding of ARP, frame forwarding, and routing protocol operations",
-        "Professional Documentation: Creation of comprehensive technical documentation meeting industry standards",
-        "Performance Optimization: Network tuning and configuration optimization for maximum efficiency",
-        "Security Implementation: Application of network security best practices and access control methods"
-    ]
+    )
     
-    for skill in technical_skills:
-        parts = skill.split(': ', 1)
-        if len(parts) == 2:
-            skills_section.append(Paragraph(f"• <b>{parts[0]}:</b> {parts[1]}", bullet_style))
-        else:
-            skills_section.append(Paragraph(f"• {skill}", bullet_style))
+    for label, text in TECHNICAL_SKILLS:
+        yield _make_bullet(label, text, bullet_style)
     
-    story.append(KeepTogether(skills_section))
-    story.append(Spacer(1, 25))
+    yield Spacer(1, 25)
     
     # Learning Outcomes - comprehensive
-    learning_section = []
-    learning_section.append(Paragraph("Professional Learning Outcomes & Career Development", subheading_style))
-    learning_section.append(Paragraph(
+    yield CondPageBreak(2*inch)
+    yield Paragraph("Professional Learning Outcomes & Career Development", subheading_style)
+    yield Paragraph(
         "The Cisco Virtual Internship Program 2025 has provided invaluable hands-on experience "
         "with enterprise networking technologies, bridging the gap between theoretical knowledge "
         "and real-world application. Key professional development outcomes include:",
         normal_style
-    ))
-    
-    learning_outcomes = [
-        "Real-World Application: Practical experience implementing enterprise solutions using industry-standard equipment",
-        "Professional Methodologies: Exposure to systematic network design, implementation, and validation processes",
-        "Industry Best Practices: Comprehensive understanding of Cisco networking standards and configuration methodologies",
-        "Analytical Problem-Solving: Development of advanced troubleshooting and network optimization skills",
-        "Career Readiness: Hands-on preparation for network engineering and infrastructure management roles",
-        "Technical Leadership: Experience in project planning, execution, and professional documentation standards"
-    ]
+    )
     
-    for outcome in learning_outcomes:
-        parts = outcome.split(': ', 1)
-        if len(parts) == 2:
-            learning_section.append(Paragraph(f"• <b>{parts[0]}:</b> {parts[1]}", bullet_style))
-        else:
-            learning_section.append(Paragraph(f"• {outcome}", bullet_style))
+    for label, text in LEARNING_OUTCOMES:
+        yield _make_bullet(label, text, bullet_style)
     
-    story.append(KeepTogether(learning_section))
-    story.append(Spacer(1, 30))
+    yield Spacer(1, 30)
     
-    # Final Assessment - keep together
-    final_section = []
-    final_section.append(Paragraph("Final Professional Assessment", subheading_style))
-    final_section.append(Paragraph(
+    # Final Assessment
+    yield Paragraph("Final Professional Assessment", subheading_style)
+    yield Paragraph(
         "This enterprise network implementation represents a comprehensive demonstration of "
         "professional-level networking capabilities. The project successfully combines solid "
         "theoretical foundations with practical implementation skills, resulting in a fully "
         "functional, well-documented network solution ready for enterprise deployment.",
         normal_style
-    ))
+    )
     
-    final_section.append(Paragraph(
+    yield Paragraph(
         "The systematic approach to network design, meticulous attention to configuration details, "
         "and comprehensive validation procedures reflect the high standards expected in professional "
         "network engineering environments. This project establishes a strong foundation for "
         "advanced networking studies and successful career development in the field.",
         normal_style
-    ))
-    
-    story.append(KeepTogether(final_section))
-    story.append(Spacer(1, 30))
+    )
+    yield Spacer(1, 30)
     
     # Project Statistics - comprehensive summary table
-    stats_section = []
-    stats_section.append(Paragraph("Comprehensive Project Statistics", subheading_style))
-    
-    stats_data = [
-        [Paragraph("<b>Project Metric</b>", table_header_style), 
-         Paragraph("<b>Achievement Details</b>", table_header_style)],
-        [Paragraph("Network Infrastructure", table_cell_style), 
-         Paragraph("6 devices configured (2 ISR routers, 2 switches, 4 PCs)", table_cell_style)],
-        [Paragraph("IP Network Implementation", table_cell_style), 
-         Paragraph("3 subnets deployed (2 LAN segments, 1 WAN connection)", table_cell_style)],
-        [Paragraph("Routing Configuration", table_cell_style), 
-         Paragraph("2 bidirectional static routes with next-hop specification", table_cell_style)],
-        [Paragraph("Connectivity Success Rate", table_cell_style), 
-         Paragraph("100% success across all 8 connectivity test scenarios", table_cell_style)],
-        [Paragraph("Validation Methodology", table_cell_style), 
-         Paragraph("Multi-layer testing: CLI validation + simulation analysis", table_cell_style)],
-        [Paragraph("Documentation Standard", table_cell_style), 
-         Paragraph("Professional technical documentation with visual evidence", table_cell_style)],
-        [Paragraph("Performance Metrics", table_cell_style), 
-         Paragraph("Optimal network convergence and packet delivery rates", table_cell_style)],
-        [Paragraph("Industry Compliance", table_cell_style), 
-         Paragraph("Cisco best practices and enterprise configuration standards", table_cell_style)]
-    ]
+    yield Paragraph("Comprehensive Project Statistics", subheading_style)
     
-    stats_table = Table(stats_data, colWidths=[2.5*inch, 3.5*inch])
-    stats_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1f4e79')),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#f8f9fa')),
-        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#1f4e79')),
-        ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
-        ('ALIGN', (0, 1), (-1, -1), 'LEFT'),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ('TOPPADDING', (0, 0), (-1, -1), 10),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
-        ('LEFTPADDING', (0, 0), (-1, -1), 8),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 8)
-    ]))
-    
-    stats_section.append(stats_table)
-    story.append(KeepTogether(stats_section))
-    story.append(Spacer(1, 40))
-    
-    # Professional Footer - keep together
-    footer_section = []
-    footer_style = ParagraphStyle(
-        'Footer',
-        parent=styles['Normal'],
-        fontSize=11,
-        alignment=1,
-        textColor=colors.HexColor('#1f4e79'),
-        fontName='Helvetica',
-        leading=14
-    )
+    stats_data = [[_p(f"<b>{header}</b>", 'hdr') for header in STATS_HEADERS]]
+    # Details overflow their column and still need Paragraph wrapping
+    stats_data += [[metric, _p(details, 'cell')] for metric, details in STATS_ROWS]
+    
+    stats_table = LongTable(stats_data, colWidths=_STATS_COLS, repeatRows=1)
+    stats_table.setStyle(_STATS_TABLE_STYLE)
     
-    footer_section.append(Paragraph(
+    yield stats_table
+    yield Spacer(1, 40)
+    
+    # Professional Footer
+    yield Paragraph(
         f"<b>Professional Report Completion</b><br/>"
-        f"Generated: {datetime.now().strftime('%B %d, %Y at %H:%M')}<br/>"
+        f"Generated: {generated_at}<br/>"
         f"Platform: Cisco Packet Tracer - Enterprise Static Routing Implementation<br/>"
         f"Project File: new.pkt<br/>"
         f"Student: Harshal Sakpal - A.P Shah Institute of Technology<br/>"
         f"<b>Cisco Virtual Internship Program 2025</b>",
         footer_style
-    ))
+    )
+
+def _report_key() -> str:
+    """Hash of this module's source and the ReportLab version, which fix the report content
+    
+    The footer's "Generated" timestamp is not part of the key, so a cached
+    report keeps the date of the run that first built it.
+    """
+    digest = hashlib.blake2b(reportlab.Version.encode(), digest_size=16)
+    with open(__file__, 'rb') as source:
+        digest.update(source.read())
+    return digest.hexdigest()
+
+def _read_report_key(key_path: str) -> str:
+    """Return the key stored next to a previously built report, if any"""
+    try:
+        with open(key_path, 'r') as key_file:
+            return key_file.read().strip()
+    except OSError:
+        return None
+
+def build_story(generated_at: str = None) -> list:
+    """Build the report flowables as the list doc.build() pops from"""
+    return list(_report_story(generated_at or _generated_at()))
+
+def render_pdf(pdf_path: str, story: list):
+    """Lay out a story into a PDF at pdf_path"""
+    doc = SimpleDocTemplate(
+        pdf_path, 
+        pagesize=A4,
+        rightMargin=15*mm,
+        leftMargin=15*mm,
+        topMargin=20*mm,
+        bottomMargin=25*mm  # Increased bottom margin
+    )
+    doc.build(story, onFirstPage=_draw_cover)
+
+def generate_one(pdf_path: str, generated_at: str = None) -> str:
+    """Build and render one report; flowables are not picklable, so each worker builds its own"""
+    render_pdf(pdf_path, build_story(generated_at))
+    return pdf_path
+
+def generate_reports(pdf_paths: list, max_workers: int = None) -> list:
+    """Render a batch of reports across worker processes, all stamped with one timestamp"""
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(generate_one, pdf_paths, repeat(_generated_at())))
+
+def create_improved_cisco_vip_report():
+    """Generate improved professional Cisco VIP 2025 PDF report with better layout"""
+    
+    # Ensure output directory exists (resolved from this file, not the CWD)
+    output_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "output")
+    os.makedirs(output_dir, exist_ok=True)
     
-    story.append(KeepTogether(footer_section))
+    pdf_path = os.path.join(output_dir, "Cisco_VIP_2025_Improved_Report_Harshal_Sakpal.pdf")
+    
+    # Skip the rebuild when the existing PDF was built from the current source
+    key_path = pdf_path + ".key"
+    report_key = _report_key()
+    if _read_report_key(key_path) == report_key and os.path.exists(pdf_path):
+        print(f"✅ Report is up to date: {pdf_path}")
+        return pdf_path
     
     # Build PDF with error handling
     try:
-        doc.build(story)
-        print(f"✅ IMPROVED PROFESSIONAL PDF REPORT GENERATED!")
-        print(f"📄 File: {pdf_path}")
-        print(f"📊 Size: {os.path.getsize(pdf_path) / 1024:.1f} KB")
-        print(f"🎯 Enhanced layout with better organization!")
-        print(f"🔧 Key Improvements:")
-        print(f"   - Better content grouping with KeepTogether")
-        print(f"   - Improved spacing and typography")
-        print(f"   - Enhanced table layouts")
-        print(f"   - Professional color scheme")
-        print(f"   - Optimized page breaks")
+        render_pdf(pdf_path, build_story())
+        with open(key_path, 'w') as key_file:
+            key_file.write(report_key)
+        print(
+            f"✅ IMPROVED PROFESSIONAL PDF REPORT GENERATED!\n"
+            f"📄 File: {pdf_path}\n"
+            f"📊 Size: {os.stat(pdf_path).st_size / 1024:.1f} KB\n"
+            f"🎯 Enhanced layout with better organization!\n"
+            f"🔧 Key Improvements:\n"
+            f"   - Headings kept with their content\n"
+            f"   - Improved spacing and typography\n"
+            f"   - Enhanced table layouts\n"
+            f"   - Professional color scheme\n"
+            f"   - Optimized page breaks"
+        )
         return pdf_path
     except Exception as e:
         print(f"❌ Error generating improved PDF: {str(e)}")
@@ -0,0 +1,24 @@
+# src/json_io.py - JSON file helpers shared by the analysis modules
+import json
+
+try:
+    import orjson  # Optional C parser/encoder for the JSON files
+except ImportError:
+    orjson = None
+
+def load_json(path: str):
+    """Load a JSON file, using orjson when it is installed"""
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r') as f:
+        return json.load(f)
+
+def dump_json(data, path: str) -> None:
+    """Write data as indented JSON in one write, using orjson when it is installed"""
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, 'w') as f:
+            f.write(json.dumps(data, indent=2))
@@ -2,13 +2,14 @@
 # src/main.py - Main CLI Interface
 
 import sys
-import json
 import argparse
+from bisect import bisect_right
+from operator import itemgetter
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
-from rich.progress import Progress
-import time
+from rich.progress import Progress, TaskID
+from dataclasses import dataclass
 
 # Import your modules
 from config_parser import ConfigParser
@@ -16,10 +17,44 @@ from network_topology import NetworkTopology
 from traffic_analyzer import TrafficAnalyzer
 from load_balancer import LoadBalancer
 from validator import NetworkValidator
+from json_io import load_json
 
 console = Console()
 
+# Utilization thresholds (percent) and the status shown for each band
+UTILIZATION_THRESHOLDS = (70, 90)
+UTILIZATION_STATUSES = ("🟢 Healthy", "🟡 Warning", "🔴 Critical")
+_bandwidth_and_utilization = itemgetter('bandwidth_mbps', 'utilization_percent')
+
+@dataclass
+class AnalysisTasks:
+    """Progress task ids for the analysis steps"""
+    progress: Progress
+    parse: TaskID
+    topology: TaskID
+    traffic: TaskID
+    balance: TaskID
+    validate: TaskID
+    
+    @classmethod
+    def create(cls, progress: Progress) -> 'AnalysisTasks':
+        """Register one progress task per analysis step"""
+        return cls(
+            progress,
+            parse=progress.add_task("[cyan]Parsing configurations...", total=100),
+            topology=progress.add_task("[green]Building topology...", total=100),
+            traffic=progress.add_task("[yellow]Analyzing traffic...", total=100),
+            balance=progress.add_task("[magenta]Load balancing analysis...", total=100),
+            validate=progress.add_task("[red]Validating configuration...", total=100)
+        )
+    
+    def done(self, step: str) -> None:
+        """Mark an analysis step as complete"""
+        self.progress.update(getattr(self, step), completed=100)
+
 class CiscoNetworkAnalyzer:
+    __slots__ = ('console', 'topology', 'traffic_analysis')
+    
     def __init__(self):
         self.console = Console()
         self.topology = None
@@ -35,55 +70,38 @@ class CiscoNetworkAnalyzer:
             style="bold blue"
         ))
         
-        with Progress() as progress:
+        with Progress(refresh_per_second=4, transient=True) as progress:
             # Task tracking
-            parse_task = progress.add_task("[cyan]Parsing configurations...", total=100)
-            topology_task = progress.add_task("[green]Building topology...", total=100)
-            traffic_task = progress.add_task("[yellow]Analyzing traffic...", total=100)
-            balance_task = progress.add_task("[magenta]Load balancing analysis...", total=100)
-            validate_task = progress.add_task("[red]Validating configuration...", total=100)
+            tasks = AnalysisTasks.create(progress)
             
             # Step 1: Parse configurations
-            progress.update(parse_task, advance=50)
             topology = NetworkTopology()
             topology.build_topology_from_configs(config_dir)
-            progress.update(parse_task, completed=100)
+            tasks.done('parse')
             
             # Step 2: Build topology
-            progress.update(topology_task, advance=50)
-            topology.export_to_json(f'{output_dir}/network_topology.json')
-            progress.update(topology_task, completed=100)
-            
-            # Load topology data
-            with open(f'{output_dir}/network_topology.json', 'r') as f:
-                topology_data = json.load(f)
+            topology_data = topology.export_to_json(f'{output_dir}/network_topology.json')
+            tasks.done('topology')
             
             # Step 3: Traffic analysis
-            progress.update(traffic_task, advance=50)
             analyzer = TrafficAnalyzer()
-            analyzer.generate_traffic_report(topology_data, f'{output_dir}/traffic_analysis.json')
-            progress.update(traffic_task, completed=100)
-            
-            # Load traffic data
-            with open(f'{output_dir}/traffic_analysis.json', 'r') as f:
-                traffic_data = json.load(f)
-                traffic_analysis = traffic_data['detailed_analysis']
+            traffic_report = analyzer.generate_traffic_report(topology_data, f'{output_dir}/traffic_analysis.json')
+            traffic_analysis = traffic_report['detailed_analysis']
+            tasks.done('traffic')
             
             # Step 4: Load balancing analysis
-            progress.update(balance_task, advance=50)
             load_balancer = LoadBalancer()
             load_balancer.generate_load_balancing_report(
                 topology_data, traffic_analysis, f'{output_dir}/load_balancing.json'
             )
-            progress.update(balance_task, completed=100)
+            tasks.done('balance')
             
             # Step 5: Network validation
-            progress.update(validate_task, advance=50)
             validator = NetworkValidator()
             validator.generate_validation_report(
                 topology_data, traffic_analysis, f'{output_dir}/validation.json'
             )
-            progress.update(validate_task, completed=100)
+            tasks.done('validate')
         
         # Display results
         self._display_results(topology_data, traffic_analysis, f'{output_dir}/validation.json')
@@ -114,19 +132,19 @@ class CiscoNetworkAnalyzer:
         traffic_table.add_column("Status", style="red")
         
         for link_id, utilization in traffic_analysis['link_utilization'].items():
-            status = "🟢 Healthy" if utilization['utilization_percent'] < 70 else "🟡 Warning" if utilization['utilization_percent'] < 90 else "🔴 Critical"
+            bandwidth_mbps, utilization_percent = _bandwidth_and_utilization(utilization)
+            status = UTILIZATION_STATUSES[bisect_right(UTILIZATION_THRESHOLDS, utilization_percent)]
             traffic_table.add_row(
                 link_id,
-                f"{utilization['bandwidth_mbps']} Mbps",
-                f"{utilization['utilization_percent']:.1f}%",
+                f"{bandwidth_mbps} Mbps",
+                f"{utilization_percent:.1f}%",
                 status
             )
         
         self.console.print(traffic_table)
         
         # Load validation results
-        with open(validation_file, 'r') as f:
-            validation_data = json.load(f)
+        validation_data = load_json(validation_file)
         
         validation_summary = validation_data['validation_summary']
         
@@ -155,13 +173,13 @@ class CiscoNetworkAnalyzer:
             style="bold green"
         ))
 
-def main():
+def main(argv=None):
     parser = argparse.ArgumentParser(description='Cisco VIP 2025 - Network Analysis Tool')
     parser.add_argument('--config-dir', default='config_files', help='Configuration files directory')
     parser.add_argument('--output-dir', default='output', help='Output directory for reports')
     parser.add_argument('--analyze', action='store_true', help='Run complete network analysis')
     
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
     analyzer = CiscoNetworkAnalyzer()
     
@@ -1,7 +1,18 @@
 import networkx as nx
-import json
+from collections import Counter, defaultdict
+from functools import lru_cache
 from typing import Dict, List, Any
 from config_parser import ConfigParser
+from json_io import dump_json
+
+@lru_cache(maxsize=None)
+def calculate_subnet(ip_address: str, subnet_mask: str) -> str:
+    """Calculate subnet from IP address and mask, memoized since interfaces share subnets"""
+    ip_parts = [int(x) for x in ip_address.split('.')]
+    mask_parts = [int(x) for x in subnet_mask.split('.')]
+    
+    subnet_parts = [ip_parts[i] & mask_parts[i] for i in range(4)]
+    return '.'.join(map(str, subnet_parts))
 
 class NetworkTopology:
     def __init__(self):
@@ -9,21 +20,37 @@ class NetworkTopology:
         self.devices = {}
         self.links = {}
         self.parser = ConfigParser()
+        self._by_type = defaultdict(set)  # device_type -> device ids
+        self._subnet_links = Counter()  # subnet -> links currently on it
+        self._link_sources = set()  # device ids that lead (are device1 of) a link
     
-    def build_topology_from_configs(self, config_directory: str) -> None:
-        """Build network topology from configuration files"""
+    def build_topology_from_configs(self, config_directory: str, config_files: List[str] = None) -> None:
+        """Build network topology from configuration files, or from config_files when already listed"""
         import os
         
+        # Keep the subnet memo bounded to the configs of this build
+        calculate_subnet.cache_clear()
+        
         # Parse all config files
-        for filename in os.listdir(config_directory):
-            if filename.endswith('.txt'):
-                file_path = os.path.join(config_directory, filename)
-                device_config = self.parser.parse_config_file(file_path)
-                
-                if device_config:
-                    device_id = device_config['device_name']
-                    self.devices[device_id] = device_config
-                    self.graph.add_node(device_id, **device_config)
+        if config_files is not None:
+            file_paths = list(config_files)
+        else:
+            with os.scandir(config_directory) as entries:
+                file_paths = [entry.path for entry in entries
+                              if entry.name.endswith('.txt') and entry.is_file()]
+        
+        device_configs = [self.parser.parse_config_file(p) for p in file_paths]
+        
+        for device_config in device_configs:
+            if device_config:
+                device_id = device_config['device_name']
+                # A reused name (e.g. several "Unknown" hosts) replaces the earlier device and its type
+                previous = self.devices.get(device_id)
+                if previous is not None:
+                    self._by_type[previous['device_type']].discard(device_id)
+                self.devices[device_id] = device_config
+                self._by_type[device_config['device_type']].add(device_id)
+                self.graph.add_node(device_id, **device_config)
         
         # Build connections based on IP networks
         self._build_connections()
@@ -39,7 +66,7 @@ class NetworkTopology:
                 subnet_mask = interface.get('subnet_mask')
                 
                 if ip_address and subnet_mask:
-                    subnet = self._calculate_subnet(ip_address, subnet_mask)
+                    subnet = calculate_subnet(ip_address, subnet_mask)
                     
                     if subnet not in subnet_devices:
                         subnet_devices[subnet] = []
@@ -52,11 +79,17 @@ class NetworkTopology:
                     })
         
         # Create subnet-based links
+        edges = []
         for subnet, devices_in_subnet in subnet_devices.items():
-            if len(devices_in_subnet) > 1:
-                for i, device1 in enumerate(devices_in_subnet):
-                    for device2 in devices_in_subnet[i+1:]:
-                        self._add_link(device1, device2, subnet)
+            if len(devices_in_subnet) < 2:
+                continue
+            
+            for i, device1 in enumerate(devices_in_subnet):
+                for device2 in devices_in_subnet[i+1:]:
+                    self._add_link(device1, device2, subnet, edges)
+        
+        # Hand every subnet edge to networkx in one batch
+        self.graph.add_edges_from(edges)
         
         # Connect switches to their logical segments
         self._connect_switches_to_segments()
@@ -68,74 +101,76 @@ class NetworkTopology:
                     if dconfig.get('device_type') == 'switch']
         
         for switch_id, switch_config in switches:
+            # A switch that already leads a link gets no further uplinks
+            if switch_id in self._link_sources:
+                continue
+            
             # Get VLANs configured on this switch
-            switch_vlans = [vlan.get('id') for vlan in switch_config.get('vlans', [])]
+            switch_vlans = frozenset(vlan.get('id') for vlan in switch_config.get('vlans', []))
             
             # Connect switch to routers and endpoints in same segments
             for other_id, other_config in self.devices.items():
-                if other_id != switch_id and switch_id not in [link['device1']['device_id'] 
-                                                              for link in self.links.values()]:
+                if other_id == switch_id:
+                    continue
+                
+                added = False
+                
+                # Strategy 1: Connect based on VLAN membership
+                if self._shares_vlan_segment(other_config, switch_vlans):
+                    added = self._add_switch_link(switch_id, other_id)
                     
-                    # Strategy 1: Connect based on VLAN membership
-                    if self._shares_vlan_segment(other_config, switch_vlans):
-                        self._add_switch_link(switch_id, other_id)
-                        
-                    # Strategy 2: Connect each switch to one router (hierarchical)
-                    elif other_config.get('device_type') == 'router':
-                        # Connect S1->R1, S2->R2, S3->R3 pattern
-                        switch_num = switch_id[-1]  # Extract number from S1, S2, S3
-                        router_num = other_id[-1]   # Extract number from R1, R2, R3
-                        
-                        if switch_num == router_num:
-                            self._add_switch_link(switch_id, other_id)
+                # Strategy 2: Connect each switch to one router (hierarchical)
+                elif other_config.get('device_type') == 'router':
+                    # Connect S1->R1, S2->R2, S3->R3 pattern
+                    switch_num = switch_id[-1]  # Extract number from S1, S2, S3
+                    router_num = other_id[-1]   # Extract number from R1, R2, R3
+                    
+                    if switch_num == router_num:
+                        added = self._add_switch_link(switch_id, other_id)
+                
+                if added:
+                    break
     
     def _shares_vlan_segment(self, device_config, switch_vlans):
-        """Check if device shares VLAN with switch"""
-        device_vlans = []
-        for interface in device_config.get('interfaces', []):
-            if interface.get('vlan'):
-                device_vlans.append(interface['vlan'])
-        
-        return bool(set(device_vlans) & set(switch_vlans))
+        """Check if device shares VLAN with switch (switch_vlans is a set)"""
+        return any(
+            (vlan := interface.get('vlan')) and vlan in switch_vlans
+            for interface in device_config.get('interfaces', ())
+        )
 
     def _add_switch_link(self, switch_id, device_id):
-        """Add link between switch and device"""
+        """Add link between switch and device, returning whether one was added"""
         link_id = f"{switch_id}-{device_id}"
         
-        if link_id not in self.links and f"{device_id}-{switch_id}" not in self.links:
-            self.links[link_id] = {
-                'device1': {'device_id': switch_id, 'interface': 'mgmt'},
-                'device2': {'device_id': device_id, 'interface': 'mgmt'},
-                'bandwidth_mbps': 1000,  # 1 Gbps management link
-                'current_utilization': 0
-            }
-            print(f"✅ Added switch link: {switch_id} <-> {device_id}")
-    
-    def _calculate_subnet(self, ip_address: str, subnet_mask: str) -> str:
-        """Calculate subnet from IP address and mask"""
-        ip_parts = [int(x) for x in ip_address.split('.')]
-        mask_parts = [int(x) for x in subnet_mask.split('.')]
+        if link_id in self.links or f"{device_id}-{switch_id}" in self.links:
+            return False
         
-        subnet_parts = [ip_parts[i] & mask_parts[i] for i in range(4)]
-        return '.'.join(map(str, subnet_parts))
+        self._link_sources.add(switch_id)
+        self.links[link_id] = {
+            'device1': {'device_id': switch_id, 'interface': 'mgmt'},
+            'device2': {'device_id': device_id, 'interface': 'mgmt'},
+            'bandwidth_mbps': 1000,  # 1 Gbps management link
+            'current_utilization': 0
+        }
+        print(f"✅ Added switch link: {switch_id} <-> {device_id}")
+        return True
     
-    def _add_link(self, device1: Dict, device2: Dict, subnet: str) -> None:
-        """Add link between two devices"""
+    def _add_link(self, device1: Dict, device2: Dict, subnet: str, edges: List) -> None:
+        """Add link between two devices, queueing its graph edge on edges"""
         link_id = f"{device1['device_id']}-{device2['device_id']}"
         
         # Use minimum bandwidth as link capacity
         link_bandwidth = min(device1['bandwidth'], device2['bandwidth'])
         
-        self.graph.add_edge(
-            device1['device_id'], 
-            device2['device_id'],
-            link_id=link_id,
-            subnet=subnet,
-            bandwidth_mbps=link_bandwidth,
-            utilization=0,
-            status='up'
-        )
+        # A device pair seen on a second subnet replaces its earlier link
+        replaced = self.links.get(link_id)
+        if replaced is not None:
+            self._subnet_links[replaced['subnet']] -= 1
+            if not self._subnet_links[replaced['subnet']]:
+                del self._subnet_links[replaced['subnet']]
+        self._subnet_links[subnet] += 1
         
+        self._link_sources.add(device1['device_id'])
         self.links[link_id] = {
             'device1': device1,
             'device2': device2,
@@ -143,30 +178,42 @@ class NetworkTopology:
             'bandwidth_mbps': link_bandwidth,
             'current_utilization': 0
         }
+        
+        edges.append((device1['device_id'], device2['device_id'], {
+            'link_id': link_id,
+            'subnet': subnet,
+            'bandwidth_mbps': link_bandwidth,
+            'utilization': 0,
+            'status': 'up'
+        }))
     
     def get_topology_summary(self) -> Dict[str, Any]:
         """Get summary of network topology"""
         return {
             'total_devices': len(self.devices),
-            'routers': len([d for d in self.devices.values() if d['device_type'] == 'router']),
-            'switches': len([d for d in self.devices.values() if d['device_type'] == 'switch']),
-            'endpoints': len([d for d in self.devices.values() if d['device_type'] == 'endpoint']),
+            'routers': len(self._by_type['router']),
+            'switches': len(self._by_type['switch']),
+            'endpoints': len(self._by_type['endpoint']),
             'total_links': len(self.links),
-            'subnets': len(set(link['subnet'] for link in self.links.values() if 'subnet' in link))
+            'subnets': len(self._subnet_links)
         }
     
-    def export_to_json(self, filename: str) -> None:
-        """Export topology to JSON file"""
-        topology_data = {
+    def to_dict(self) -> Dict[str, Any]:
+        """Get topology as a JSON-ready dictionary"""
+        return {
             'devices': self.devices,
             'links': self.links,
             'summary': self.get_topology_summary()
         }
+    
+    def export_to_json(self, filename: str) -> Dict[str, Any]:
+        """Export topology to JSON file"""
+        topology_data = self.to_dict()
         
-        with open(filename, 'w') as f:
-            json.dump(topology_data, f, indent=2)
+        dump_json(topology_data, filename)
         
         print(f"Topology exported to {filename}")
+        return topology_data
 
 # Test the topology builder
 if __name__ == "__main__":
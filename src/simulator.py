@@ -1,79 +1,103 @@
 #!/usr/bin/env python3
 # src/simulator.py - Network Simulator for Day-1 scenarios
 
-import threading
-import time
-import json
+import asyncio
 import queue
 import random
+import sys
+import time
 from datetime import datetime
 import os
+from json_io import dump_json, load_json
+
+# Device log lines wait here and reach stdout in batches
+_LOG_QUEUE = queue.SimpleQueue()
+_LOG_FLUSH_INTERVAL = 0.05  # seconds
+
+def _flush_logs():
+    """Write all queued log lines to stdout in one call"""
+    lines = []
+    try:
+        while True:
+            lines.append(_LOG_QUEUE.get_nowait())
+    except queue.Empty:
+        pass
+    if lines:
+        sys.stdout.write('\n'.join(lines) + '\n')
+
+# Log timestamps have one-second resolution, so format each second only once
+_clock = [None, '']
+
+def _log_timestamp():
+    """Current time as HH:MM:SS, reformatted only when the second changes"""
+    second = int(time.time())
+    if second != _clock[0]:
+        _clock[0] = second
+        _clock[1] = time.strftime('%H:%M:%S', time.localtime(second))
+    return _clock[1]
+
+async def _log_writer():
+    """Flush the log queue periodically while the simulation runs"""
+    while True:
+        await asyncio.sleep(_LOG_FLUSH_INTERVAL)
+        _flush_logs()
 
-class NetworkDevice(threading.Thread):
+class NetworkDevice:
     def __init__(self, device_id, device_type, config):
-        super().__init__()
         self.device_id = device_id
         self.device_type = device_type
         self.config = config
-        self.running = False
         self.logs = []
         
     def log_event(self, event_type, description):
-        timestamp = datetime.now().strftime('%H:%M:%S')
+        timestamp = _log_timestamp()
         log_entry = f"[{timestamp}] {self.device_id}: {description}"
         self.logs.append(log_entry)
-        print(log_entry)
+        _LOG_QUEUE.put(log_entry)
         
-    def start_simulation(self):
-        self.running = True
-        self.start()
-        
-    def run(self):
+    async def run(self):
+        """Boot the device and run its periodic tasks until cancelled"""
         # Simulate device boot
         self.log_event("BOOT", "Device starting up")
-        time.sleep(random.uniform(1, 3))
+        await asyncio.sleep(random.uniform(1, 3))
         
         if self.device_type == 'router':
-            self.simulate_router_startup()
+            await self.simulate_router_startup()
         elif self.device_type == 'switch':
-            self.simulate_switch_startup()
+            await self.simulate_switch_startup()
         elif self.device_type == 'endpoint':
-            self.simulate_endpoint_startup()
+            await self.simulate_endpoint_startup()
             
         # Main operation loop
-        while self.running:
+        while True:
             self.periodic_tasks()
-            time.sleep(2)
+            await asyncio.sleep(2)
             
-    def simulate_router_startup(self):
+    async def simulate_router_startup(self):
         self.log_event("OSPF", "OSPF process starting")
-        time.sleep(1)
+        await asyncio.sleep(1)
         self.log_event("INTERFACE", "Interfaces coming up")
         
-    def simulate_switch_startup(self):
+    async def simulate_switch_startup(self):
         self.log_event("STP", "Spanning Tree Protocol enabled")
-        time.sleep(1)
+        await asyncio.sleep(1)
         self.log_event("VLAN", "VLAN configuration loaded")
         
-    def simulate_endpoint_startup(self):
+    async def simulate_endpoint_startup(self):
         self.log_event("DHCP", "Requesting IP address")
-        time.sleep(1)
+        await asyncio.sleep(1)
         self.log_event("ARP", "Learning gateway MAC address")
         
     def periodic_tasks(self):
         if random.random() < 0.1:  # 10% chance
             self.log_event("HEARTBEAT", "Device operational")
-    
-    def stop_simulation(self):
-        self.running = False
 
 class NetworkSimulator:
     def __init__(self):
         self.devices = {}
         
     def load_topology(self, topology_file):
-        with open(topology_file, 'r') as f:
-            topology_data = json.load(f)
+        topology_data = load_json(topology_file)
             
         for device_id, config in topology_data['devices'].items():
             device_type = config['device_type']
@@ -86,24 +110,28 @@ class NetworkSimulator:
         print("🚀 Starting Day-1 Network Simulation")
         print("=" * 50)
         
-        # Start all devices
-        for device in self.devices.values():
-            device.start_simulation()
-        
         print(f"⏱️  Running simulation for {duration_seconds} seconds...")
-        time.sleep(duration_seconds)
         
-        # Stop simulation
-        for device in self.devices.values():
-            device.stop_simulation()
-            
-        # Wait for threads to complete
-        for device in self.devices.values():
-            device.join(timeout=2)
+        # All devices share one event loop instead of a thread each
+        asyncio.run(self._run_devices(duration_seconds))
             
         self.generate_simulation_report()
         print("✅ Day-1 simulation completed!")
         
+    async def _run_devices(self, duration_seconds):
+        """Run every device until the simulation time is up"""
+        writer = asyncio.create_task(_log_writer())
+        try:
+            await asyncio.wait_for(
+                asyncio.gather(*(device.run() for device in self.devices.values())),
+                duration_seconds
+            )
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            writer.cancel()
+            _flush_logs()
+        
     def generate_simulation_report(self):
         report = {
             'timestamp': datetime.now().isoformat(),
@@ -115,12 +143,12 @@ class NetworkSimulator:
             report['simulation_logs'][device_id] = device.logs
             
         os.makedirs('output', exist_ok=True)
-        with open('output/day1_simulation.json', 'w') as f:
-            json.dump(report, f, indent=2)
+        # The report is encoded up front so it reaches the file in one write
+        dump_json(report, 'output/day1_simulation.json')
             
         print("📊 Simulation report saved to output/day1_simulation.json")
 
-if __name__ == "__main__":
+def main():
     try:
         simulator = NetworkSimulator()
         simulator.load_topology('output/network_topology.json')
@@ -129,3 +157,6 @@ if __name__ == "__main__":
         print("❌ Run main analysis first: python src/main.py --analyze")
     except Exception as e:
         print(f"❌ Simulation error: {e}")
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,9 @@
 # src/traffic_analyzer.py - FIXED VERSION
-import json
 import os
+import re
 from typing import Dict, List, Any
 from datetime import datetime
+from json_io import dump_json, load_json
 
 class TrafficAnalyzer:
     def __init__(self):
@@ -14,6 +15,8 @@ class TrafficAnalyzer:
             'iot_sensors': {'regular': 0.05, 'peak': 0.1, 'priority': 'low'},
             'file_transfer': {'regular': 20, 'peak': 100, 'priority': 'medium'}
         }
+        # One pattern finds every application name in a single scan
+        self._app_re = re.compile('|'.join(re.escape(app_name) for app_name in self.application_profiles))
     
     def analyze_network_traffic(self, topology_data: Dict, current_hour: int = 14) -> Dict[str, Any]:
         """Analyze traffic patterns across the network - SIMPLIFIED"""
@@ -27,22 +30,27 @@ class TrafficAnalyzer:
             }
             
             # Analyze device loads (simplified)
+            current_rates = self._current_rates(current_hour)
             for device_id, device_config in topology_data.get('devices', {}).items():
                 if device_config.get('device_type') == 'endpoint':
-                    device_load = self._calculate_simple_device_load(device_config, current_hour)
+                    device_load = self._calculate_simple_device_load(device_config, current_rates)
                     traffic_analysis['device_load'][device_id] = device_load
             
+            # Every link carries the same estimated traffic, so sum the device loads once
+            link_traffic = self._estimate_link_traffic(traffic_analysis['device_load'])
+            
             # Analyze link utilization (simplified)
             for link_id, link_info in topology_data.get('links', {}).items():
-                link_utilization = self._calculate_simple_link_utilization(link_info, traffic_analysis['device_load'])
+                link_utilization = self._calculate_simple_link_utilization(link_info, link_traffic)
                 traffic_analysis['link_utilization'][link_id] = link_utilization
                 
                 # Check for bottlenecks
-                if link_utilization['utilization_percent'] > 80:
+                utilization_percent = link_utilization['utilization_percent']
+                if utilization_percent > 80:
                     traffic_analysis['bottlenecks'].append({
                         'link_id': link_id,
-                        'utilization': link_utilization['utilization_percent'],
-                        'severity': 'critical' if link_utilization['utilization_percent'] > 90 else 'warning'
+                        'utilization': utilization_percent,
+                        'severity': 'critical' if utilization_percent > 90 else 'warning'
                     })
             
             # Generate simple recommendations
@@ -62,7 +70,13 @@ class TrafficAnalyzer:
                 'error': str(e)
             }
     
-    def _calculate_simple_device_load(self, device_config: Dict, current_hour: int) -> Dict[str, Any]:
+    def _current_rates(self, current_hour: int) -> Dict[str, float]:
+        """Current load (Mbps) of each application for the given hour"""
+        # Simple time-based load calculation
+        rate_key = 'peak' if 9 <= current_hour <= 17 else 'regular'  # Business hours
+        return {app_name: profile[rate_key] for app_name, profile in self.application_profiles.items()}
+    
+    def _calculate_simple_device_load(self, device_config: Dict, current_rates: Dict[str, float]) -> Dict[str, Any]:
         """Calculate simple device load"""
         device_load = {
             'total_regular_mbps': 0,
@@ -75,23 +89,15 @@ class TrafficAnalyzer:
         default_apps = ['web_browsing']
         
         # Check if device config mentions specific applications
-        device_str = str(device_config).lower()
-        detected_apps = []
-        for app_name in self.application_profiles.keys():
-            if app_name in device_str:
-                detected_apps.append(app_name)
+        found_apps = set(self._app_re.findall(str(device_config).lower()))
+        detected_apps = [app_name for app_name in self.application_profiles if app_name in found_apps]
         
         apps_to_analyze = detected_apps if detected_apps else default_apps
         
         for app_name in apps_to_analyze:
             if app_name in self.application_profiles:
                 app_profile = self.application_profiles[app_name]
-                
-                # Simple time-based load calculation
-                if 9 <= current_hour <= 17:  # Business hours
-                    current_load = app_profile['peak']
-                else:
-                    current_load = app_profile['regular']
+                current_load = current_rates[app_name]
                 
                 app_load_info = {
                     'application': app_name,
@@ -108,23 +114,22 @@ class TrafficAnalyzer:
         
         return device_load
     
-    def _calculate_simple_link_utilization(self, link_info: Dict, device_loads: Dict) -> Dict[str, Any]:
-        """Calculate simple link utilization"""
-        # Get link bandwidth
-        link_bandwidth = link_info.get('bandwidth_mbps', 100)  # Default 100 Mbps
-        
-        # Calculate total traffic (simplified)
+    def _estimate_link_traffic(self, device_loads: Dict) -> float:
+        """Estimate the traffic each link carries from the endpoint loads"""
         total_traffic = 0
         
-        # Add traffic from endpoints (simplified calculation)
-        device1_id = link_info.get('device1', {}).get('device_id', '')
-        device2_id = link_info.get('device2', {}).get('device_id', '')
-        
         # Simple traffic estimation based on connected devices
-        for device_id, load_info in device_loads.items():
+        for load_info in device_loads.values():
             # If this device might use this link, add its traffic
             total_traffic += load_info.get('current_load_mbps', 0) * 0.5  # 50% of device traffic per link
         
+        return total_traffic
+    
+    def _calculate_simple_link_utilization(self, link_info: Dict, total_traffic: float) -> Dict[str, Any]:
+        """Calculate simple link utilization"""
+        # Get link bandwidth
+        link_bandwidth = link_info.get('bandwidth_mbps', 100)  # Default 100 Mbps
+        
         # Calculate utilization
         utilization_percent = min((total_traffic / link_bandwidth) * 100, 100) if link_bandwidth > 0 else 0
         
@@ -161,7 +166,7 @@ class TrafficAnalyzer:
         
         return recommendations
     
-    def generate_traffic_report(self, topology_data: Dict, output_file: str) -> None:
+    def generate_traffic_report(self, topology_data: Dict, output_file: str) -> Dict[str, Any]:
         """Generate traffic analysis report"""
         try:
             analysis_results = self.analyze_network_traffic(topology_data)
@@ -180,10 +185,10 @@ class TrafficAnalyzer:
             # Ensure output directory exists
             os.makedirs(os.path.dirname(output_file), exist_ok=True)
             
-            with open(output_file, 'w') as f:
-                json.dump(report, f, indent=2)
+            dump_json(report, output_file)
             
             print(f"✅ Traffic analysis report saved to {output_file}")
+            return report
             
         except Exception as e:
             print(f"❌ Error generating traffic report: {str(e)}")
@@ -197,18 +202,17 @@ class TrafficAnalyzer:
             
             try:
                 os.makedirs(os.path.dirname(output_file), exist_ok=True)
-                with open(output_file, 'w') as f:
-                    json.dump(minimal_report, f, indent=2)
+                dump_json(minimal_report, output_file)
             except:
                 pass
+            return minimal_report
 
 # Test the traffic analyzer
 if __name__ == "__main__":
     try:
         # Load topology data
         if os.path.exists('output/network_topology.json'):
-            with open('output/network_topology.json', 'r') as f:
-                topology_data = json.load(f)
+            topology_data = load_json('output/network_topology.json')
             
             print("🔍 Testing Traffic Analyzer...")
             analyzer = TrafficAnalyzer()
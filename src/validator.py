@@ -1,9 +1,95 @@
 # src/validator.py
-import json
 import re
 import networkx as nx
 from typing import Dict, List, Any, Set, Tuple
 from collections import defaultdict
+from dataclasses import dataclass
+from datetime import datetime
+from json_io import dump_json, load_json
+from network_topology import calculate_subnet
+
+def _iter_strings(value: Any):
+    """Yield the string keys and leaves of a nested config structure"""
+    if isinstance(value, str):
+        yield value
+    elif isinstance(value, dict):
+        for key, item in value.items():
+            if isinstance(key, str):
+                yield key
+            yield from _iter_strings(item)
+    elif isinstance(value, (list, tuple, set)):
+        for item in value:
+            yield from _iter_strings(item)
+
+def _articulation_points_and_bridges(graph: nx.Graph) -> Tuple[List, List[Tuple]]:
+    """Find articulation points and bridges with one iterative Tarjan low-link DFS
+    
+    Results come out in the same order as nx.articulation_points and nx.bridges.
+    """
+    articulation_points = []
+    seen_points = set()
+    bridge_edges = set()
+    discovery = {}
+    low = {}
+    
+    for start in graph:
+        if start in discovery:
+            continue
+        discovery[start] = low[start] = len(discovery)
+        root_children = 0
+        stack = [(start, start, iter(graph[start]))]
+        
+        while stack:
+            grandparent, parent, children = stack[-1]
+            try:
+                child = next(children)
+                if child == grandparent:
+                    continue
+                if child in discovery:
+                    # Back edge
+                    if discovery[child] < low[parent]:
+                        low[parent] = discovery[child]
+                else:
+                    discovery[child] = low[child] = len(discovery)
+                    stack.append((parent, child, iter(graph[child])))
+            except StopIteration:
+                stack.pop()
+                if not stack:
+                    continue
+                if low[parent] > discovery[grandparent]:
+                    bridge_edges.add((grandparent, parent))
+                if len(stack) > 1:
+                    if low[parent] >= discovery[grandparent] and grandparent not in seen_points:
+                        seen_points.add(grandparent)
+                        articulation_points.append(grandparent)
+                    if low[parent] < low[grandparent]:
+                        low[grandparent] = low[parent]
+                else:
+                    root_children += 1
+        
+        # The DFS root is an articulation point only if it has more than one subtree
+        if root_children > 1 and start not in seen_points:
+            seen_points.add(start)
+            articulation_points.append(start)
+    
+    bridges = [(u, v) for u, v in graph.edges() if (u, v) in bridge_edges or (v, u) in bridge_edges]
+    return articulation_points, bridges
+
+@dataclass
+class TopologyIndex:
+    """Lookups derived once from topology data and shared by every rule"""
+    by_device_type: Dict[str, List[str]]
+    device_type_of: Dict[str, str]
+    interfaces_flat: List[Tuple[str, Dict]]
+    vlan_ids_by_device: Dict[str, Set]
+    subnet_of_iface: Dict[Tuple[str, str], str]
+    iface_mtu_by_subnet: Dict[Tuple[str, str], int]
+    device_has_stp: Dict[str, bool]
+    protocol_usage: Dict[str, int]
+    vlan_ids: Set
+    default_vlan_devices: List[str]
+    graph: nx.Graph
+    infrastructure_graph: nx.Graph
 
 class NetworkValidator:
     def __init__(self):
@@ -34,12 +120,16 @@ class NetworkValidator:
             'detailed_results': {}
         }
         
+        calculate_subnet.cache_clear()
+        index = self._build_index(topology_data)
+        
+        # Every rule reads the same index, built once above
         for rule_name, rule_function in self.validation_rules.items():
             try:
                 if rule_name == 'capacity_validation' and traffic_analysis:
-                    result = rule_function(topology_data, traffic_analysis)
+                    result = rule_function(topology_data, traffic_analysis, index=index)
                 else:
-                    result = rule_function(topology_data)
+                    result = rule_function(topology_data, index=index)
                 
                 validation_results['detailed_results'][rule_name] = result
                 
@@ -70,31 +160,41 @@ class NetworkValidator:
         
         return validation_results
     
-    def check_ip_conflicts(self, topology_data: Dict) -> Dict[str, Any]:
+    def check_ip_conflicts(self, topology_data: Dict, index: TopologyIndex = None) -> Dict[str, Any]:
         """Check for duplicate IP addresses within the same VLAN/subnet"""
-        ip_usage = defaultdict(list)
-        conflicts = []
+        index = index or self._build_index(topology_data)
+        seen = {}
+        conflicts_by_key = {}
         
-        for device_id, device_config in topology_data['devices'].items():
-            for interface in device_config.get('interfaces', []):
-                ip_address = interface.get('ip_address')
-                vlan = interface.get('vlan', 'default')
-                
-                if ip_address:
-                    ip_usage[(ip_address, vlan)].append({
-                        'device': device_id,
-                        'interface': interface['name'],
-                        'vlan': vlan
-                    })
-        
-        for (ip, vlan), devices in ip_usage.items():
-            if len(devices) > 1:
-                conflicts.append({
-                    'ip_address': ip,
+        # Single pass: a key only gets a conflict entry once it is seen a second time
+        for position, (device_id, interface) in enumerate(index.interfaces_flat):
+            ip_address = interface.get('ip_address')
+            if not ip_address:
+                continue
+            
+            vlan = interface.get('vlan', 'default')
+            key = (ip_address, vlan)
+            usage = {
+                'device': device_id,
+                'interface': interface['name'],
+                'vlan': vlan
+            }
+            
+            if key in conflicts_by_key:
+                conflicts_by_key[key]['conflicting_devices'].append(usage)
+            elif key in seen:
+                conflicts_by_key[key] = {
+                    'ip_address': ip_address,
                     'vlan': vlan,
-                    'conflicting_devices': devices,
+                    'conflicting_devices': [seen[key][1], usage],
                     'severity': 'critical'
-                })
+                }
+            else:
+                seen[key] = (position, usage)
+        
+        # Report conflicts in the order their address first appeared
+        conflicts = sorted(conflicts_by_key.values(),
+                           key=lambda conflict: seen[(conflict['ip_address'], conflict['vlan'])][0])
         
         return {
             'status': 'fail' if conflicts else 'pass',
@@ -103,8 +203,9 @@ class NetworkValidator:
                            for conflict in conflicts]
         }
     
-    def check_vlan_consistency(self, topology_data: Dict) -> Dict[str, Any]:
+    def check_vlan_consistency(self, topology_data: Dict, index: TopologyIndex = None) -> Dict[str, Any]:
         """Check VLAN configuration consistency"""
+        index = index or self._build_index(topology_data)
         vlan_configs = defaultdict(set)
         vlan_issues = []
         
@@ -118,9 +219,10 @@ class NetworkValidator:
                     vlan_configs[vlan_id].add(vlan_name)
             
             # Check interface VLAN assignments
+            vlan_ids = index.vlan_ids_by_device[device_id]
             for interface in device_config.get('interfaces', []):
                 vlan = interface.get('vlan')
-                if vlan and vlan not in [v.get('id') for v in device_config.get('vlans', [])]:
+                if vlan and vlan not in vlan_ids:
                     vlan_issues.append({
                         'device': device_id,
                         'interface': interface['name'],
@@ -143,26 +245,23 @@ class NetworkValidator:
             'suggestions': ['Standardize VLAN naming conventions across all devices']
         }
     
-    def check_gateway_configuration(self, topology_data: Dict) -> Dict[str, Any]:
+    def check_gateway_configuration(self, topology_data: Dict, index: TopologyIndex = None) -> Dict[str, Any]:
         """Validate gateway configurations"""
+        index = index or self._build_index(topology_data)
         gateway_issues = []
         subnet_gateways = defaultdict(list)
         
-        # Collect all gateway configurations
-        for device_id, device_config in topology_data['devices'].items():
-            for interface in device_config.get('interfaces', []):
-                ip_address = interface.get('ip_address')
-                subnet_mask = interface.get('subnet_mask')
+        # Collect all gateway configurations; only router interfaces can be gateways
+        for device_id in index.by_device_type.get('router', []):
+            for interface in topology_data['devices'][device_id].get('interfaces', []):
+                subnet = index.subnet_of_iface.get((device_id, interface.get('name')))
                 
-                if ip_address and subnet_mask:
-                    subnet = self._calculate_subnet(ip_address, subnet_mask)
-                    
-                    if device_config['device_type'] == 'router':
-                        subnet_gateways[subnet].append({
-                            'device': device_id,
-                            'interface': interface['name'],
-                            'ip': ip_address
-                        })
+                if subnet:
+                    subnet_gateways[subnet].append({
+                        'device': device_id,
+                        'interface': interface['name'],
+                        'ip': interface['ip_address']
+                    })
         
         # Check for missing gateways
         for link_id, link_info in topology_data['links'].items():
@@ -192,18 +291,16 @@ class NetworkValidator:
             'suggestions': ['Verify default gateway configuration on all subnets']
         }
     
-    def check_mtu_mismatches(self, topology_data: Dict) -> Dict[str, Any]:
+    def check_mtu_mismatches(self, topology_data: Dict, index: TopologyIndex = None) -> Dict[str, Any]:
         """Check for MTU mismatches between connected interfaces"""
+        index = index or self._build_index(topology_data)
         mtu_issues = []
         
         for link_id, link_info in topology_data['links'].items():
-            device1_interfaces = self._get_device_interfaces(topology_data, link_info['device1']['device_id'])
-            device2_interfaces = self._get_device_interfaces(topology_data, link_info['device2']['device_id'])
-            
             # Find interfaces on the same subnet
             subnet = link_info.get('subnet')
-            device1_mtu = self._get_interface_mtu_for_subnet(device1_interfaces, subnet)
-            device2_mtu = self._get_interface_mtu_for_subnet(device2_interfaces, subnet)
+            device1_mtu = index.iface_mtu_by_subnet.get((link_info['device1']['device_id'], subnet))
+            device2_mtu = index.iface_mtu_by_subnet.get((link_info['device2']['device_id'], subnet))
             
             if device1_mtu and device2_mtu and device1_mtu != device2_mtu:
                 mtu_issues.append({
@@ -221,50 +318,30 @@ class NetworkValidator:
             'suggestions': [f'Standardize MTU settings on link {issue["link_id"]}' for issue in mtu_issues]
         }
     
-    def check_network_loops(self, topology_data: Dict) -> Dict[str, Any]:
+    def check_network_loops(self, topology_data: Dict, index: TopologyIndex = None) -> Dict[str, Any]:
         """Detect potential network loops"""
-        # Build graph for loop detection
-        graph = nx.Graph()
+        index = index or self._build_index(topology_data)
+        graph = index.infrastructure_graph
         
-        for device_id, device_config in topology_data['devices'].items():
-            if device_config['device_type'] in ['router', 'switch']:
-                graph.add_node(device_id, device_type=device_config['device_type'])
-        
-        for link_id, link_info in topology_data['links'].items():
-            device1 = link_info['device1']['device_id']
-            device2 = link_info['device2']['device_id']
-            
-            if device1 in graph and device2 in graph:
-                graph.add_edge(device1, device2, link_id=link_id)
-        
-        # Find cycles (potential loops)
+        # Find loop-bearing regions (one fundamental cycle per independent loop)
         loops = []
-        try:
-            cycles = list(nx.simple_cycles(nx.DiGraph(graph)))
-            for cycle in cycles:
-                if len(cycle) > 2:  # Ignore direct back-and-forth connections
-                    loops.append({
-                        'devices_in_loop': cycle,
-                        'loop_length': len(cycle),
-                        'severity': 'warning',
-                        'recommendation': 'Verify spanning-tree protocol configuration'
-                    })
-        except:
-            # NetworkX might not find cycles in undirected graph, use alternative method
-            pass
+        for cycle in nx.cycle_basis(graph):
+            loops.append({
+                'devices_in_loop': cycle,
+                'loop_length': len(cycle),
+                'severity': 'warning',
+                'recommendation': 'Verify spanning-tree protocol configuration'
+            })
         
         # Check for spanning tree configuration in switches
         stp_issues = []
-        for device_id, device_config in topology_data['devices'].items():
-            if device_config['device_type'] == 'switch':
-                # This is a simplified check - in reality, you'd parse the actual config
-                device_str = str(device_config)
-                if 'spanning-tree' not in device_str.lower():
-                    stp_issues.append({
-                        'device': device_id,
-                        'issue': 'No spanning-tree configuration detected',
-                        'severity': 'warning'
-                    })
+        for device_id in index.by_device_type.get('switch', []):
+            if not index.device_has_stp[device_id]:
+                stp_issues.append({
+                    'device': device_id,
+                    'issue': 'No spanning-tree configuration detected',
+                    'severity': 'warning'
+                })
         
         all_issues = loops + stp_issues
         
@@ -275,36 +352,25 @@ class NetworkValidator:
                            'Consider implementing rapid spanning-tree (RSTP) for faster convergence']
         }
     
-    def check_missing_components(self, topology_data: Dict) -> Dict[str, Any]:
+    def check_missing_components(self, topology_data: Dict, index: TopologyIndex = None) -> Dict[str, Any]:
         """Check for missing network components"""
+        index = index or self._build_index(topology_data)
         missing_components = []
         
         # Check for isolated endpoints (no path to router)
-        graph = nx.Graph()
-        routers = []
-        endpoints = []
+        graph = index.graph
+        routers = index.by_device_type.get('router', [])
+        endpoints = index.by_device_type.get('endpoint', [])
         
-        for device_id, device_config in topology_data['devices'].items():
-            graph.add_node(device_id)
-            if device_config['device_type'] == 'router':
-                routers.append(device_id)
-            elif device_config['device_type'] == 'endpoint':
-                endpoints.append(device_id)
-        
-        for link_id, link_info in topology_data['links'].items():
-            device1 = link_info['device1']['device_id']
-            device2 = link_info['device2']['device_id']
-            graph.add_edge(device1, device2)
+        # Check connectivity from endpoints to routers with one component labelling pass
+        component_of = {}
+        for component_id, component in enumerate(nx.connected_components(graph)):
+            for node in component:
+                component_of[node] = component_id
+        router_components = {component_of[router] for router in routers}
         
-        # Check connectivity from endpoints to routers
         for endpoint in endpoints:
-            connected_to_router = False
-            for router in routers:
-                if nx.has_path(graph, endpoint, router):
-                    connected_to_router = True
-                    break
-            
-            if not connected_to_router:
+            if component_of[endpoint] not in router_components:
                 missing_components.append({
                     'endpoint': endpoint,
                     'issue': f'Endpoint {endpoint} has no path to any router',
@@ -339,18 +405,12 @@ class NetworkValidator:
             'suggestions': ['Ensure all endpoints have connectivity to network infrastructure']
         }
     
-    def check_routing_protocol_optimization(self, topology_data: Dict) -> Dict[str, Any]:
+    def check_routing_protocol_optimization(self, topology_data: Dict, index: TopologyIndex = None) -> Dict[str, Any]:
         """Check routing protocol configuration and suggest optimizations"""
+        index = index or self._build_index(topology_data)
         routing_issues = []
-        router_count = len([d for d in topology_data['devices'].values() if d['device_type'] == 'router'])
-        
-        # Analyze current routing protocols
-        protocol_usage = defaultdict(int)
-        for device_id, device_config in topology_data['devices'].items():
-            if device_config['device_type'] == 'router':
-                for protocol in device_config.get('routing_protocols', []):
-                    protocol_name = protocol.get('protocol', 'unknown')
-                    protocol_usage[protocol_name] += 1
+        router_count = len(index.by_device_type.get('router', []))
+        protocol_usage = index.protocol_usage
         
         # Recommend BGP for large networks
         if router_count > 20 and protocol_usage.get('OSPF', 0) > protocol_usage.get('BGP', 0):
@@ -384,17 +444,13 @@ class NetworkValidator:
             'suggestions': ['Optimize routing protocol selection based on network size and requirements']
         }
     
-    def check_security_zones(self, topology_data: Dict) -> Dict[str, Any]:
+    def check_security_zones(self, topology_data: Dict, index: TopologyIndex = None) -> Dict[str, Any]:
         """Check network segmentation and security zones"""
+        index = index or self._build_index(topology_data)
         security_issues = []
         
         # Check VLAN segmentation
-        vlan_count = len(set(
-            interface.get('vlan')
-            for device_config in topology_data['devices'].values()
-            for interface in device_config.get('interfaces', [])
-            if interface.get('vlan')
-        ))
+        vlan_count = len(index.vlan_ids)
         
         device_count = len(topology_data['devices'])
         
@@ -406,11 +462,7 @@ class NetworkValidator:
             })
         
         # Check for default VLAN usage
-        default_vlan_devices = []
-        for device_id, device_config in topology_data['devices'].items():
-            for interface in device_config.get('interfaces', []):
-                if interface.get('vlan') == 1:  # Default VLAN
-                    default_vlan_devices.append(device_id)
+        default_vlan_devices = index.default_vlan_devices
         
         if default_vlan_devices:
             security_issues.append({
@@ -425,25 +477,16 @@ class NetworkValidator:
             'suggestions': ['Implement proper network segmentation and security zones']
         }
     
-    def check_redundancy(self, topology_data: Dict) -> Dict[str, Any]:
+    def check_redundancy(self, topology_data: Dict, index: TopologyIndex = None) -> Dict[str, Any]:
         """Check network redundancy and single points of failure"""
+        index = index or self._build_index(topology_data)
         redundancy_issues = []
         
-        # Build graph for connectivity analysis
-        graph = nx.Graph()
-        for device_id in topology_data['devices'].keys():
-            graph.add_node(device_id)
-        
-        for link_id, link_info in topology_data['links'].items():
-            device1 = link_info['device1']['device_id']
-            device2 = link_info['device2']['device_id']
-            graph.add_edge(device1, device2)
-        
-        # Find articulation points (single points of failure)
-        articulation_points = list(nx.articulation_points(graph))
+        # Find articulation points (single points of failure) and bridges in one DFS
+        articulation_points, bridges = _articulation_points_and_bridges(index.graph)
         
         for node in articulation_points:
-            device_type = topology_data['devices'][node]['device_type']
+            device_type = index.device_type_of[node]
             redundancy_issues.append({
                 'device': node,
                 'device_type': device_type,
@@ -453,7 +496,6 @@ class NetworkValidator:
             })
         
         # Check bridge connectivity (links whose removal would disconnect the network)
-        bridges = list(nx.bridges(graph))
         for bridge in bridges:
             device1, device2 = bridge
             redundancy_issues.append({
@@ -469,7 +511,7 @@ class NetworkValidator:
             'suggestions': ['Implement redundant paths and eliminate single points of failure']
         }
     
-    def check_capacity_adequacy(self, topology_data: Dict, traffic_analysis: Dict) -> Dict[str, Any]:
+    def check_capacity_adequacy(self, topology_data: Dict, traffic_analysis: Dict, index: TopologyIndex = None) -> Dict[str, Any]:
         """Check if network capacity is adequate for current and projected traffic"""
         capacity_issues = []
         
@@ -505,40 +547,84 @@ class NetworkValidator:
         }
     
     # Helper methods
+    def _build_index(self, topology_data: Dict) -> TopologyIndex:
+        """Walk devices and interfaces once to build the lookups shared by all rules"""
+        by_device_type = defaultdict(list)
+        device_type_of = {}
+        interfaces_flat = []
+        vlan_ids_by_device = {}
+        subnet_of_iface = {}
+        iface_mtu_by_subnet = {}
+        device_has_stp = {}
+        protocol_usage = defaultdict(int)
+        vlan_ids = set()
+        default_vlan_devices = []
+        
+        for device_id, device_config in topology_data['devices'].items():
+            device_type = device_config.get('device_type')
+            by_device_type[device_type].append(device_id)
+            device_type_of[device_id] = device_type
+            vlan_ids_by_device[device_id] = {v.get('id') for v in device_config.get('vlans', [])}
+            
+            for interface in device_config.get('interfaces', []):
+                interfaces_flat.append((device_id, interface))
+                vlan = interface.get('vlan')
+                if vlan:
+                    vlan_ids.add(vlan)
+                    if vlan == 1:  # Default VLAN
+                        default_vlan_devices.append(device_id)
+                ip_address = interface.get('ip_address')
+                subnet_mask = interface.get('subnet_mask')
+                if ip_address and subnet_mask:
+                    subnet = self._calculate_subnet(ip_address, subnet_mask)
+                    subnet_of_iface[(device_id, interface.get('name'))] = subnet
+                    # First interface on a subnet decides the device's MTU there
+                    iface_mtu_by_subnet.setdefault((device_id, subnet), interface.get('mtu', 1500))
+            
+            if device_type == 'router':
+                for protocol in device_config.get('routing_protocols', []):
+                    protocol_usage[protocol.get('protocol', 'unknown')] += 1
+            elif device_type == 'switch':
+                # Scan string leaves only, stopping at the first spanning-tree mention
+                device_has_stp[device_id] = any('spanning-tree' in text.lower() for text in _iter_strings(device_config))
+        
+        # One connectivity graph for all rules; loop detection sees only its router/switch subgraph
+        graph = nx.Graph()
+        graph.add_nodes_from(topology_data['devices'])
+        graph.add_edges_from(
+            (link_info['device1']['device_id'], link_info['device2']['device_id'], {'link_id': link_id})
+            for link_id, link_info in topology_data['links'].items()
+        )
+        infrastructure_graph = graph.subgraph(by_device_type.get('router', []) + by_device_type.get('switch', []))
+        
+        return TopologyIndex(
+            by_device_type=dict(by_device_type),
+            device_type_of=device_type_of,
+            interfaces_flat=interfaces_flat,
+            vlan_ids_by_device=vlan_ids_by_device,
+            subnet_of_iface=subnet_of_iface,
+            iface_mtu_by_subnet=iface_mtu_by_subnet,
+            device_has_stp=device_has_stp,
+            protocol_usage=dict(protocol_usage),
+            vlan_ids=vlan_ids,
+            default_vlan_devices=default_vlan_devices,
+            graph=graph,
+            infrastructure_graph=infrastructure_graph
+        )
+    
     def _calculate_subnet(self, ip_address: str, subnet_mask: str) -> str:
-        """Calculate subnet from IP address and mask"""
+        """Calculate subnet from IP address and mask, falling back to the address when malformed"""
         try:
-            ip_parts = [int(x) for x in ip_address.split('.')]
-            mask_parts = [int(x) for x in subnet_mask.split('.')]
-            subnet_parts = [ip_parts[i] & mask_parts[i] for i in range(4)]
-            return '.'.join(map(str, subnet_parts))
-        except:
+            return calculate_subnet(ip_address, subnet_mask)
+        except (ValueError, IndexError, AttributeError, TypeError):
             return ip_address
     
-    def _get_device_interfaces(self, topology_data: Dict, device_id: str) -> List[Dict]:
-        """Get all interfaces for a device"""
-        device_config = topology_data['devices'].get(device_id, {})
-        return device_config.get('interfaces', [])
-    
-    def _get_interface_mtu_for_subnet(self, interfaces: List[Dict], subnet: str) -> int:
-        """Get MTU for interface in specific subnet"""
-        for interface in interfaces:
-            ip_address = interface.get('ip_address')
-            subnet_mask = interface.get('subnet_mask')
-            
-            if ip_address and subnet_mask:
-                interface_subnet = self._calculate_subnet(ip_address, subnet_mask)
-                if interface_subnet == subnet:
-                    return interface.get('mtu', 1500)
-        
-        return None
-    
     def generate_validation_report(self, topology_data: Dict, traffic_analysis: Dict, output_file: str) -> None:
         """Generate comprehensive validation report"""
         validation_results = self.validate_network_configuration(topology_data, traffic_analysis)
         
         report = {
-            'timestamp': json.dumps(dict(), default=str),
+            'timestamp': datetime.now().isoformat(),
             'validation_summary': {
                 'overall_score': validation_results['overall_score'],
                 'total_checks': validation_results['total_checks'],
@@ -551,21 +637,17 @@ class NetworkValidator:
             'detailed_results': validation_results
         }
         
-        with open(output_file, 'w') as f:
-            json.dump(report, f, indent=2)
+        dump_json(report, output_file)
         
         print(f"Network validation report saved to {output_file}")
 
 # Test the validator
 if __name__ == "__main__":
     # Load required data
-    with open('output/network_topology.json', 'r') as f:
-        topology_data = json.load(f)
+    topology_data = load_json('output/network_topology.json')
     
     try:
-        with open('output/traffic_analysis.json', 'r') as f:
-            traffic_data = json.load(f)
-            traffic_analysis = traffic_data['detailed_analysis']
+        traffic_analysis = load_json('output/traffic_analysis.json')['detailed_analysis']
     except:
         traffic_analysis = None
     
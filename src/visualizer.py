@@ -1,7 +1,16 @@
-import json
 import matplotlib.pyplot as plt
 import networkx as nx
 import os
+from collections import defaultdict
+from json_io import load_json
+
+try:
+    import pygraphviz  # Optional: enables Graphviz's multilevel sfdp layout
+except ImportError:
+    pygraphviz = None
+
+# Above this many nodes the O(N^2) spring layout gets a reduced iteration budget
+SPRING_LAYOUT_MAX_NODES = 50
 
 class NetworkVisualizer:
     def __init__(self):
@@ -11,34 +20,31 @@ class NetworkVisualizer:
     def _build_connections(self) -> None:
         """Enhanced connection building for switches"""
         
+        # Index devices by interface VLAN so each switch only visits devices it shares a VLAN with
+        devices_by_vlan = defaultdict(list)
+        for device_id, device_config in self.devices.items():
+            device_vlans = {interface['vlan'] for interface in device_config.get('interfaces', []) if interface.get('vlan')}
+            for vlan in device_vlans:
+                devices_by_vlan[vlan].append(device_id)
+        device_order = {device_id: position for position, device_id in enumerate(self.devices)}
+        
         # Existing subnet-based connections (for routers/endpoints)
         for device_id, device_config in self.devices.items():
             if device_config.get('device_type') == 'switch':
                 # Connect switches to devices in same physical segment
-                self._connect_switch_to_local_devices(device_id, device_config)
+                self._connect_switch_to_local_devices(device_id, device_config, devices_by_vlan, device_order)
 
-    def _connect_switch_to_local_devices(self, switch_id, switch_config):
+    def _connect_switch_to_local_devices(self, switch_id, switch_config, devices_by_vlan, device_order):
         """Connect switch to devices in same network segment"""
         
         # Find devices that should connect to this switch
         # Based on VLAN membership or physical proximity
-        vlans_on_switch = [vlan.get('id') for vlan in switch_config.get('vlans', [])]
+        vlans_on_switch = {vlan.get('id') for vlan in switch_config.get('vlans', [])}
+        candidates = set().union(*(devices_by_vlan.get(vlan, ()) for vlan in vlans_on_switch))
+        candidates.discard(switch_id)
         
-        for other_device_id, other_device_config in self.devices.items():
-            if other_device_id != switch_id:
-                # Connect if devices share VLANs or are in same segment
-                if self._should_connect_to_switch(other_device_config, vlans_on_switch):
-                    self._add_switch_link(switch_id, other_device_id)
-
-    def _should_connect_to_switch(self, device_config, vlans_on_switch):
-        """Determine if device should connect to switch"""
-        # Check VLAN membership
-        device_vlans = []
-        for interface in device_config.get('interfaces', []):
-            if interface.get('vlan'):
-                device_vlans.append(interface['vlan'])
-        
-        return bool(set(device_vlans) & set(vlans_on_switch))
+        for other_device_id in sorted(candidates, key=device_order.__getitem__):
+            self._add_switch_link(switch_id, other_device_id)
 
     def _add_switch_link(self, switch_id, device_id):
         """Add a link between switch and device"""
@@ -48,10 +54,17 @@ class NetworkVisualizer:
             'device2': {'device_id': device_id}
         }
 
+def _layout(G):
+    """Node positions, via sfdp when Graphviz is available"""
+    if pygraphviz is not None:
+        return nx.nx_agraph.graphviz_layout(G, prog='sfdp')
+    if len(G) < SPRING_LAYOUT_MAX_NODES:
+        return nx.spring_layout(G, seed=42, k=3)
+    return nx.spring_layout(G, seed=42, k=3, iterations=20)
+
 def create_topology_image():
     # Load your topology data
-    with open('output/network_topology.json', 'r') as f:
-        data = json.load(f)
+    data = load_json('output/network_topology.json')
     
     # Create network graph
     G = nx.Graph()
@@ -71,8 +84,8 @@ def create_topology_image():
         G.add_edge(src, dst)
     
     # Create and save visualization
-    plt.figure(figsize=(12, 8))
-    pos = nx.spring_layout(G, seed=42, k=3)
+    fig = plt.figure(figsize=(12, 8))
+    pos = _layout(G)
     nx.draw(G, pos, with_labels=True, node_color=node_colors, 
             node_size=1000, font_size=8, font_weight='bold')
     
@@ -95,6 +108,8 @@ def create_topology_image():
         plt.show()  # This will open in default image viewer
     except:
         print("📌 To view image: Open 'output/diagrams/network_topology.png' in VS Code or image viewer")
+    
+    plt.close(fig)
 
 if __name__ == "__main__":
     create_topology_image()
\ No newline at end of file
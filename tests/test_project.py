@@ -3,36 +3,141 @@
 
 import sys
 import os
-import json
+import io
+import traceback
+from contextlib import contextmanager, redirect_stdout
+from functools import lru_cache, partial
 from pathlib import Path
 
 # Add src directory to Python path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
+# Import the analyzers once; a missing module only fails the tests that need it
+_IMPORT_ERRORS = {}
+try:
+    from config_parser import ConfigParser
+except ImportError as e:
+    ConfigParser = None
+    _IMPORT_ERRORS['config_parser'] = e
+try:
+    from network_topology import NetworkTopology
+except ImportError as e:
+    NetworkTopology = None
+    _IMPORT_ERRORS['network_topology'] = e
+try:
+    from traffic_analyzer import TrafficAnalyzer
+except ImportError as e:
+    TrafficAnalyzer = None
+    _IMPORT_ERRORS['traffic_analyzer'] = e
+try:
+    from load_balancer import LoadBalancer
+except ImportError as e:
+    LoadBalancer = None
+    _IMPORT_ERRORS['load_balancer'] = e
+try:
+    from validator import NetworkValidator
+except ImportError as e:
+    NetworkValidator = None
+    _IMPORT_ERRORS['validator'] = e
+try:
+    from json_io import load_json
+except ImportError as e:
+    load_json = None
+    _IMPORT_ERRORS['json_io'] = e
+
+@lru_cache(maxsize=None)
+def _load_json_cached(path: str, mtime_ns: int, size: int):
+    """Parse a JSON file once per on-disk version"""
+    return load_json(path)
+
+def _load_json(path: str):
+    """Load a JSON output file, shared between tests until it changes on disk
+    
+    The returned dict is cached, so tests must treat it as read-only.
+    """
+    stat = os.stat(path)
+    return _load_json_cached(path, stat.st_mtime_ns, stat.st_size)
+
+def _artifact(artifacts, name: str, path: str):
+    """Data produced earlier in this run, falling back to its JSON file on disk"""
+    if artifacts and name in artifacts:
+        return artifacts[name]
+    try:
+        return _load_json(path)
+    except FileNotFoundError:
+        return None
+
+def _run_captured(test_function):
+    """Run a test with its output buffered, returning its result and everything it printed"""
+    output = io.StringIO()
+    with redirect_stdout(output):
+        result = test_function()
+    return result, output.getvalue()
+
+def _fast_glob(dirpath: str, suffix: str):
+    """Files in dirpath ending in suffix; DirEntry caches the file type from the directory read"""
+    with os.scandir(dirpath) as entries:
+        return [entry.path for entry in entries if entry.name.endswith(suffix) and entry.is_file()]
+
+# Config file paths listed by setup_test_environment, shared by the parser and topology tests
+_CONFIG_FILES = None
+
+def _unmet_prerequisites(requires, artifacts):
+    """Results a test needs that this run did not produce"""
+    return [name for name in requires if name not in artifacts]
+
+def _report_skip(test_name: str, missing) -> None:
+    """Announce a test skipped because an earlier test failed to produce its input"""
+    print(f"\n⏭️  Skipping {test_name}: no {' or '.join(missing)} results from this run")
+
+@contextmanager
+def _buffered_stdout():
+    """Collect prints in memory and emit them with one write when the block exits"""
+    buffer = io.StringIO()
+    try:
+        with redirect_stdout(buffer):
+            yield
+    finally:
+        sys.stdout.write(buffer.getvalue())
+
+@contextmanager
+def _test_guard(component: str):
+    """Report an exception from a test body as that component's error; TB_VERBOSE=1 adds the traceback"""
+    try:
+        yield
+    except Exception as e:
+        print(f"❌ {component} error: {str(e)}")
+        if os.environ.get('TB_VERBOSE') == '1':
+            traceback.print_exc()
+
 def setup_test_environment():
     """Set up test environment"""
+    global _CONFIG_FILES
+    
     # Create output directory if it doesn't exist
     Path('output').mkdir(exist_ok=True)
     Path('config_files').mkdir(exist_ok=True)
+    _CONFIG_FILES = tuple(_fast_glob('config_files', '.txt'))
     
     print("🔧 Test environment setup complete")
 
 def test_config_parser():
     """Test configuration parser"""
     print("🔍 Testing Configuration Parser...")
-    try:
-        from config_parser import ConfigParser
+    with _test_guard("Config Parser"):
+        if ConfigParser is None:
+            raise _IMPORT_ERRORS['config_parser']
         parser = ConfigParser()
         
         # Check if config files exist
-        config_files = list(Path('config_files').glob('*.txt'))
+        config_files = _CONFIG_FILES if _CONFIG_FILES is not None else _fast_glob('config_files', '.txt')
         if not config_files:
             print("⚠️  No config files found in config_files/ directory")
             return False
         
         # Test with first available config file
         config_file = config_files[0]
-        result = parser.parse_config_file(str(config_file))
+        result = parser.parse_config_file(config_file)
         
         if result and result.get('device_name'):
             print(f"✅ Config Parser working! Found device: {result['device_name']}")
@@ -44,18 +149,17 @@ def test_config_parser():
             print("❌ Config Parser failed - no valid data returned")
             return False
             
-    except Exception as e:
-        print(f"❌ Config Parser error: {str(e)}")
-        return False
+    return False  # The guard swallowed an exception
 
-def test_topology_builder():
+def test_topology_builder(artifacts=None):
     """Test topology builder"""
     print("\n🌐 Testing Topology Builder...")
-    try:
-        from network_topology import NetworkTopology
+    with _test_guard("Topology Builder"):
+        if NetworkTopology is None:
+            raise _IMPORT_ERRORS['network_topology']
         topology = NetworkTopology()
         
-        topology.build_topology_from_configs("config_files")
+        topology.build_topology_from_configs("config_files", config_files=_CONFIG_FILES)
         summary = topology.get_topology_summary()
         
         if summary['total_devices'] > 0:
@@ -67,31 +171,29 @@ def test_topology_builder():
             print(f"   - Links: {summary['total_links']}")
             
             # Export for other tests
-            topology.export_to_json('output/network_topology.json')
+            topology_data = topology.export_to_json('output/network_topology.json')
+            if artifacts is not None:
+                artifacts['topology'] = topology_data
             return True
         else:
             print("❌ Topology Builder failed - no devices found")
             return False
             
-    except Exception as e:
-        print(f"❌ Topology Builder error: {str(e)}")
-        return False
+    return False  # The guard swallowed an exception
 
-def test_traffic_analyzer():
+def test_traffic_analyzer(artifacts=None):
     """Test traffic analyzer"""
     print("\n📊 Testing Traffic Analyzer...")
-    try:
-        from traffic_analyzer import TrafficAnalyzer
+    with _test_guard("Traffic Analyzer"):
+        if TrafficAnalyzer is None:
+            raise _IMPORT_ERRORS['traffic_analyzer']
         
-        # Check if topology file exists
-        if not Path('output/network_topology.json').exists():
+        # Load topology data
+        topology_data = _artifact(artifacts, 'topology', 'output/network_topology.json')
+        if topology_data is None:
             print("❌ Network topology file not found")
             return False
         
-        # Load topology data
-        with open('output/network_topology.json', 'r') as f:
-            topology_data = json.load(f)
-        
         analyzer = TrafficAnalyzer()
         analysis = analyzer.analyze_network_traffic(topology_data)
         
@@ -102,36 +204,33 @@ def test_traffic_analyzer():
             print(f"   - Recommendations: {len(analysis['recommendations'])}")
             
             # Export for other tests
-            analyzer.generate_traffic_report(topology_data, 'output/traffic_analysis.json')
+            traffic_data = analyzer.generate_traffic_report(topology_data, 'output/traffic_analysis.json')
+            if artifacts is not None:
+                artifacts['traffic'] = traffic_data
             return True
         else:
             print("❌ Traffic Analyzer failed")
             return False
             
-    except Exception as e:
-        print(f"❌ Traffic Analyzer error: {str(e)}")
-        return False
+    return False  # The guard swallowed an exception
 
-def test_load_balancer():
+def test_load_balancer(artifacts=None):
     """Test load balancer"""
     print("\n⚖️  Testing Load Balancer...")
-    try:
-        from load_balancer import LoadBalancer
+    with _test_guard("Load Balancer"):
+        if LoadBalancer is None:
+            raise _IMPORT_ERRORS['load_balancer']
         
-        # Check required files
-        required_files = ['output/network_topology.json', 'output/traffic_analysis.json']
-        for file_path in required_files:
-            if not Path(file_path).exists():
+        # Load data, checking required files
+        topology_data = _artifact(artifacts, 'topology', 'output/network_topology.json')
+        traffic_data = _artifact(artifacts, 'traffic', 'output/traffic_analysis.json')
+        for file_path, data in (('output/network_topology.json', topology_data),
+                                ('output/traffic_analysis.json', traffic_data)):
+            if data is None:
                 print(f"❌ Required file {file_path} not found")
                 return False
         
-        # Load data
-        with open('output/network_topology.json', 'r') as f:
-            topology_data = json.load(f)
-        
-        with open('output/traffic_analysis.json', 'r') as f:
-            traffic_data = json.load(f)
-            traffic_analysis = traffic_data['detailed_analysis']
+        traffic_analysis = traffic_data['detailed_analysis']
         
         load_balancer = LoadBalancer()
         analysis = load_balancer.analyze_load_balancing_opportunities(topology_data, traffic_analysis)
@@ -143,31 +242,26 @@ def test_load_balancer():
         
         return True
             
-    except Exception as e:
-        print(f"❌ Load Balancer error: {str(e)}")
-        return False
+    return False  # The guard swallowed an exception
 
-def test_validator():
+def test_validator(artifacts=None):
     """Test network validator"""
     print("\n🔍 Testing Network Validator...")
-    try:
-        from validator import NetworkValidator
+    with _test_guard("Network Validator"):
+        if NetworkValidator is None:
+            raise _IMPORT_ERRORS['validator']
         
-        # Check required files
-        if not Path('output/network_topology.json').exists():
+        # Load data, checking required files
+        topology_data = _artifact(artifacts, 'topology', 'output/network_topology.json')
+        if topology_data is None:
             print("❌ Network topology file not found")
             return False
         
-        # Load data
-        with open('output/network_topology.json', 'r') as f:
-            topology_data = json.load(f)
-        
         # Try to load traffic analysis (optional)
         traffic_analysis = None
-        if Path('output/traffic_analysis.json').exists():
-            with open('output/traffic_analysis.json', 'r') as f:
-                traffic_data = json.load(f)
-                traffic_analysis = traffic_data['detailed_analysis']
+        traffic_data = _artifact(artifacts, 'traffic', 'output/traffic_analysis.json')
+        if traffic_data is not None:
+            traffic_analysis = traffic_data['detailed_analysis']
         
         validator = NetworkValidator()
         results = validator.validate_network_configuration(topology_data, traffic_analysis)
@@ -181,36 +275,45 @@ def test_validator():
         
         return True
             
-    except Exception as e:
-        print(f"❌ Network Validator error: {str(e)}")
-        return False
+    return False  # The guard swallowed an exception
 
 def run_complete_test():
     """Run complete system test"""
-    print("🚀 Cisco VIP 2025 - Network Analysis Tool")
-    print("=" * 50)
-    print("Starting Comprehensive System Test...\n")
-    
-    # Setup test environment
-    setup_test_environment()
+    with _buffered_stdout():
+        print("🚀 Cisco VIP 2025 - Network Analysis Tool")
+        print("=" * 50)
+        print("Starting Comprehensive System Test...\n")
+        
+        # Setup test environment
+        setup_test_environment()
     
-    # Define test sequence
+    # Define test sequence as (name, test, results it requires); topology and traffic
+    # results are handed on in memory
+    artifacts = {}
     tests = [
-        ("Configuration Parser", test_config_parser),
-        ("Topology Builder", test_topology_builder),
-        ("Traffic Analyzer", test_traffic_analyzer),
-        ("Load Balancer", test_load_balancer),
-        ("Network Validator", test_validator)
+        ("Configuration Parser", test_config_parser, ()),
+        ("Topology Builder", partial(test_topology_builder, artifacts=artifacts), ()),
+        ("Traffic Analyzer", partial(test_traffic_analyzer, artifacts=artifacts), ('topology',)),
+        ("Load Balancer", partial(test_load_balancer, artifacts=artifacts), ('topology', 'traffic')),
+        ("Network Validator", partial(test_validator, artifacts=artifacts), ('topology',))
     ]
     
     passed = 0
     total = len(tests)
     failed_tests = []
     
-    # Run tests
-    for test_name, test_function in tests:
+    # Run tests, skipping those whose inputs were not produced in this run
+    for test_name, test_function, requires in tests:
+        missing = _unmet_prerequisites(requires, artifacts)
+        if missing:
+            _report_skip(test_name, missing)
+            failed_tests.append(test_name)
+            continue
         try:
-            if test_function():
+            # Buffer each test's lines and emit them in one write
+            result, output = _run_captured(test_function)
+            sys.stdout.write(output)
+            if result:
                 passed += 1
             else:
                 failed_tests.append(test_name)
@@ -218,31 +321,32 @@ def run_complete_test():
             print(f"❌ {test_name} crashed: {str(e)}")
             failed_tests.append(test_name)
     
-    # Results summary
-    print("\n" + "=" * 50)
-    print("📋 TEST RESULTS SUMMARY")
-    print("=" * 50)
-    print(f"Total Tests: {total}")
-    print(f"Passed: {passed}")
-    print(f"Failed: {total - passed}")
-    print(f"Success Rate: {(passed/total)*100:.1f}%")
-    
-    if passed == total:
-        print("\n🎉 ALL TESTS PASSED! Your system is working perfectly!")
-        print("✅ Ready for production use")
-    elif passed > total // 2:
-        print(f"\n✅ Most tests passed! {passed}/{total} components working")
-        if failed_tests:
-            print(f"⚠️  Failed components: {', '.join(failed_tests)}")
-    else:
-        print(f"\n❌ Multiple failures detected. Failed components:")
-        for test in failed_tests:
-            print(f"   - {test}")
-    
-    print("\n📁 Generated files:")
-    output_files = list(Path('output').glob('*.json'))
-    for file_path in output_files:
-        print(f"   - {file_path}")
+    # Results summary, emitted in one write
+    with _buffered_stdout():
+        print("\n" + "=" * 50)
+        print("📋 TEST RESULTS SUMMARY")
+        print("=" * 50)
+        print(f"Total Tests: {total}")
+        print(f"Passed: {passed}")
+        print(f"Failed: {total - passed}")
+        print(f"Success Rate: {(passed/total)*100:.1f}%")
+        
+        if passed == total:
+            print("\n🎉 ALL TESTS PASSED! Your system is working perfectly!")
+            print("✅ Ready for production use")
+        elif passed > total // 2:
+            print(f"\n✅ Most tests passed! {passed}/{total} components working")
+            if failed_tests:
+                print(f"⚠️  Failed components: {', '.join(failed_tests)}")
+        else:
+            print(f"\n❌ Multiple failures detected. Failed components:")
+            for test in failed_tests:
+                print(f"   - {test}")
+        
+        print("\n📁 Generated files:")
+        output_files = _fast_glob('output', '.json')
+        for file_path in output_files:
+            print(f"   - {file_path}")
 
 if __name__ == "__main__":
     run_complete_test()
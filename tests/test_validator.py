@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+# test_validator.py - Regression tests for the validator's graph helpers
+
+import os
+import sys
+
+import networkx as nx
+
+# Add the repository's src directory to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+from validator import _articulation_points_and_bridges
+
+
+def _assert_matches_networkx(graph):
+    """The fused DFS must return what networkx does, in the same order"""
+    articulation_points, bridges = _articulation_points_and_bridges(graph)
+    assert articulation_points == list(nx.articulation_points(graph))
+    assert bridges == list(nx.bridges(graph))
+
+
+def test_disconnected_graph():
+    """Components are searched independently, including isolated nodes"""
+    graph = nx.Graph([('R1', 'R2'), ('R2', 'R3'), ('R3', 'R1'), ('R3', 'S1'),
+                      ('S2', 'PC1'), ('S2', 'PC2')])
+    graph.add_node('PC3')
+    _assert_matches_networkx(graph)
+
+
+def test_self_loop():
+    """A self-loop is neither a bridge nor a reason to mark a cut vertex"""
+    graph = nx.Graph([('R1', 'R1'), ('R1', 'S1'), ('S1', 'PC1'), ('S1', 'S1')])
+    _assert_matches_networkx(graph)
+
+
+def test_cut_vertex_root():
+    """The DFS root is a cut vertex only when it has several DFS children"""
+    graph = nx.Graph([('R1', 'S1'), ('R1', 'S2'), ('S1', 'PC1'), ('S2', 'PC2'), ('S2', 'PC3')])
+    _assert_matches_networkx(graph)
+    assert 'R1' in _articulation_points_and_bridges(graph)[0]
+
+
+def test_cycles_and_chords():
+    """Edges on a cycle are not bridges; the tails hanging off it are"""
+    graph = nx.Graph([('R1', 'R2'), ('R2', 'R3'), ('R3', 'R4'), ('R4', 'R1'), ('R1', 'R3'),
+                      ('R4', 'S1'), ('S1', 'S2'), ('S2', 'PC1')])
+    _assert_matches_networkx(graph)
+    _assert_matches_networkx(nx.gnm_random_graph(40, 55, seed=7))